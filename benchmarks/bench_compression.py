@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+"""
+todo app - Compression Benchmark
+CPU cost vs bytes saved for typical POST /api/tasks responses
+
+Encodes format_response envelopes of 10, 100 and 1000 tasks and compresses
+them with every available encoding (gzip always; brotli and zstd when
+installed) at a range of levels, reporting compressed size, ratio and
+time per response.
+"""
+
+import sys
+import os
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.common import best_time, format_ns
+from modules.compression import available_encodings, compress
+from modules.core import input_tasks
+from modules.serializer import encode_response
+
+SIZES = [10, 100, 1_000]
+LEVELS = {"gzip": [1, 6, 9], "br": [1, 4, 8, 11], "zstd": [1, 3, 9, 19]}
+
+
+def main():
+    """Run the benchmark and print size/time per encoding and level"""
+    print(f"⏱️  response compression ({', '.join(available_encodings())})")
+    print(f"{'tasks':>6} {'encoding':>9} {'level':>6} {'bytes':>9} {'ratio':>7} {'time':>12} {'MB/s':>8}")
+    for size in SIZES:
+        body = encode_response(input_tasks([f"Task number {i}: buy milk and eggs" for i in range(size)]))
+        print(f"{size:>6} {'identity':>9} {'-':>6} {len(body):>9,} {1.0:>6.1f}x")
+        for encoding in available_encodings():
+            for level in LEVELS[encoding]:
+                number = max(1, 200_000 // len(body))
+                seconds = best_time(lambda: compress(body, encoding, level), number=number)
+                compressed = len(compress(body, encoding, level))
+                print(f"{size:>6} {encoding:>9} {level:>6} {compressed:>9,} {len(body) / compressed:>6.1f}x "
+                      f"{format_ns(seconds):>12} {len(body) / seconds / 1e6:>8.1f}")
+
+
+if __name__ == "__main__":
+    main()
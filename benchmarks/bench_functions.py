@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+todo app - Function Micro-benchmarks
+Per-call cost of the core and utility functions across input sizes
+
+Covers input_tasks, validate_input, process_data, format_response,
+get_timestamp and sanitize_filename. Save a run with --save and check a
+later one against it with --compare; the script exits non-zero when any
+case is slower than the baseline by more than --threshold.
+
+Usage:
+    python benchmarks/bench_functions.py --save benchmark-results/functions.json
+    python benchmarks/bench_functions.py --compare benchmark-results/functions.json --threshold 0.2
+"""
+
+import argparse
+import json
+import os
+import sys
+import timeit
+from typing import Any, Callable, Dict, List, Tuple
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.common import format_ns
+from modules.core import input_tasks, process_data, validate_input
+from modules.utils import format_response, get_timestamp, sanitize_filename
+
+SIZES = [10, 1_000, 100_000]
+
+
+def cases(sizes: List[int]) -> List[Tuple[str, int, Callable[[], Any]]]:
+    """
+    Build the (function, size, callable) cases to time
+
+    Size is the list length for input_tasks/format_response and the string
+    length for the single-value functions; get_timestamp has no size.
+    """
+    built = [("get_timestamp", 0, get_timestamp)]
+    for size in sizes:
+        descriptions = [f"  Task number {i}  " for i in range(size)]
+        text = ("a" * (size - 1) + " ")[:size]
+        filename = ('report<1>:"draft"?.txt' * (size // 22 + 1))[:size]
+        built += [
+            ("input_tasks", size, lambda d=descriptions: input_tasks(d)),
+            ("format_response", size, lambda d=descriptions: format_response(d)),
+            ("validate_input", size, lambda t=text: validate_input(t)),
+            ("process_data", size, lambda t=text: process_data(t)),
+            ("sanitize_filename", size, lambda f=filename: sanitize_filename(f)),
+        ]
+    return built
+
+
+def time_case(func: Callable[[], Any], repeat: int) -> float:
+    """Best seconds per call, with the loop count picked by timeit.autorange"""
+    timer = timeit.Timer(func)
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat=repeat, number=number)) / number
+
+
+def compare(results: Dict[str, float], baseline_path: str, threshold: float) -> bool:
+    """Print per-case deltas; False if any case regressed past threshold"""
+    with open(baseline_path) as f:
+        baseline = json.load(f)["results"]
+    ok = True
+    print(f"\n📉 Compared with {baseline_path} (threshold {threshold:.0%})")
+    for key, seconds in results.items():
+        before = baseline.get(key)
+        if not before:
+            continue
+        change = seconds / before - 1
+        regressed = change > threshold
+        ok = ok and not regressed
+        print(f"{'❌' if regressed else '✅'} {key:<28} {format_ns(before):>12} → {format_ns(seconds):>12} {change:+.1%}")
+    return ok
+
+
+def main():
+    """Run the benchmarks, then optionally save or compare a baseline"""
+    parser = argparse.ArgumentParser(description="Micro-benchmark the core and utility functions")
+    parser.add_argument("--sizes", type=int, nargs="+", default=SIZES, help="Input sizes to time")
+    parser.add_argument("--repeat", type=int, default=5, help="Timed runs per case (best is kept)")
+    parser.add_argument("--save", help="Write results to this JSON file")
+    parser.add_argument("--compare", help="Baseline JSON file to compare against")
+    parser.add_argument("--threshold", type=float, default=0.20, help="Allowed slowdown (default: 0.20)")
+    args = parser.parse_args()
+
+    print("⏱️  per-call cost")
+    print(f"{'function':<20} {'size':>8} {'time':>12}")
+    results: Dict[str, float] = {}
+    for name, size, func in cases(args.sizes):
+        seconds = time_case(func, args.repeat)
+        results[f"{name}[{size}]"] = seconds
+        print(f"{name:<20} {size:>8,} {format_ns(seconds):>12}")
+
+    if args.save:
+        os.makedirs(os.path.dirname(os.path.abspath(args.save)), exist_ok=True)
+        with open(args.save, "w") as f:
+            json.dump({"python": sys.version.split()[0], "results": results}, f, indent=2)
+        print(f"📄 Baseline saved: {os.path.abspath(args.save)}")
+
+    if args.compare and not compare(results, args.compare, args.threshold):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
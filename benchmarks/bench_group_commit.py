@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+todo app - Group Commit Benchmark
+Durable task inserts per second, one commit per request vs group commit
+
+Runs N threads, each inserting small batches (as concurrent POST /api/tasks
+requests would) into a scratch database opened with synchronous=FULL, so
+every commit fsyncs the WAL. Compares writing straight to the TaskStore
+(one transaction and fsync per batch) with a GroupCommitter at a few
+window sizes, reporting tasks/sec, per-call latency and commits issued.
+
+Usage:
+    python benchmarks/bench_group_commit.py --threads 32 --batches 200
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import threading
+import time
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from modules.core import input_tasks
+from modules.storage import GroupCommitter, TaskStore
+
+DELAYS_MS = [0, 1, 2, 5]
+
+
+def run(writer, threads: int, batches: int, batch_size: int):
+    """Insert from all threads at once; returns (seconds, per-call latencies)"""
+    latencies = []
+    lock = threading.Lock()
+    start_gate = threading.Barrier(threads + 1)
+
+    def worker(n):
+        tasks = input_tasks([f"Worker {n} task {i}" for i in range(batch_size)])
+        mine = []
+        start_gate.wait()
+        for _ in range(batches):
+            began = time.perf_counter()
+            writer.insert_tasks(tasks)
+            mine.append(time.perf_counter() - began)
+        with lock:
+            latencies.extend(mine)
+
+    pool = [threading.Thread(target=worker, args=(n,)) for n in range(threads)]
+    for thread in pool:
+        thread.start()
+    start_gate.wait()
+    began = time.perf_counter()
+    for thread in pool:
+        thread.join()
+    return time.perf_counter() - began, latencies
+
+
+def report(name: str, seconds: float, latencies, tasks: int, commits: int) -> None:
+    quantiles = statistics.quantiles(latencies, n=100)
+    print(f"{name:<18} {tasks / seconds:>12,.0f} {quantiles[49] * 1000:>9.2f} ms "
+          f"{quantiles[98] * 1000:>9.2f} ms {commits:>9,}")
+
+
+def main():
+    """Run the benchmark and print throughput per writer"""
+    parser = argparse.ArgumentParser(description="Measure group commit throughput")
+    parser.add_argument("--threads", type=int, default=16, help="Concurrent writers")
+    parser.add_argument("--batches", type=int, default=100, help="Inserts per writer")
+    parser.add_argument("--batch-size", type=int, default=5, help="Tasks per insert")
+    parser.add_argument("--synchronous", default="FULL", help="PRAGMA synchronous level")
+    args = parser.parse_args()
+
+    tasks = args.threads * args.batches * args.batch_size
+    print(f"⏱️  {args.threads} writers x {args.batches} inserts x {args.batch_size} tasks, "
+          f"synchronous={args.synchronous}")
+    print(f"{'writer':<18} {'tasks/sec':>12} {'p50':>12} {'p99':>12} {'commits':>9}")
+    with tempfile.TemporaryDirectory(prefix="todo-group-commit-") as workdir:
+        store = TaskStore(os.path.join(workdir, "direct.db"), args.synchronous)
+        seconds, latencies = run(store, args.threads, args.batches, args.batch_size)
+        report("direct", seconds, latencies, tasks, args.threads * args.batches)
+
+        for delay in DELAYS_MS:
+            store = TaskStore(os.path.join(workdir, f"group-{delay}.db"), args.synchronous)
+            committer = GroupCommitter(store, max_delay=delay / 1000)
+            seconds, latencies = run(committer, args.threads, args.batches, args.batch_size)
+            committer.close()
+            report(f"group {delay} ms", seconds, latencies, tasks, committer.groups)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""
+todo app - input_tasks Micro-benchmark
+Per-task cost of input_tasks at 10, 1k and 100k items
+
+Compares the batch-stamped implementation against the previous per-item
+version (function-local import, one timestamp and two strips per task).
+"""
+
+import sys
+import os
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.common import best_time, format_ns
+from modules.core import input_tasks, validate_input
+
+SIZES = [10, 1_000, 100_000]
+
+
+def input_tasks_per_item(task_list):
+    """Previous implementation, kept as the comparison baseline"""
+    from modules.utils import get_timestamp
+    tasks = []
+    for idx, desc in enumerate(task_list, 1):
+        if validate_input(desc):
+            tasks.append({
+                "id": idx,
+                "description": desc.strip(),
+                "created": get_timestamp(),
+                "completed": False
+            })
+    return tasks
+
+
+def main():
+    """Run the benchmark and print per-task costs"""
+    print("⏱️  input_tasks per-task cost")
+    print(f"{'items':>8} {'per-item (old)':>16} {'batch (new)':>14} {'speedup':>8}")
+    for size in SIZES:
+        descriptions = [f"  Task number {i}  " for i in range(size)]
+        number = max(1, 10_000 // size)
+        old = best_time(lambda: input_tasks_per_item(descriptions), number=number) / size
+        new = best_time(lambda: input_tasks(descriptions), number=number) / size
+        print(f"{size:>8,} {format_ns(old):>16} {format_ns(new):>14} {old / new:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+"""
+todo app - Serializer Benchmark
+Encoding cost of large task lists across JSON backends
+
+For each installed backend, times encoding a format_response envelope of
+N tasks: building the envelope dict then encoding it, versus the
+pre-encoded envelope path (encode_response).
+"""
+
+import sys
+import os
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.common import best_time, format_ns
+from modules import serializer
+from modules.core import input_tasks
+from modules.utils import format_response
+
+SIZES = [100, 10_000, 100_000]
+
+
+def main():
+    """Run the benchmark and print per-task encoding costs"""
+    backends = serializer.available_backends()
+    default = serializer.dumps
+    print(f"⏱️  Envelope encoding per task (backends: {', '.join(backends)})")
+    print(f"{'items':>8} {'backend':>8} {'dict+dumps':>12} {'pre-encoded':>12} {'bytes':>12}")
+    for size in SIZES:
+        tasks = input_tasks([f"Task number {i}" for i in range(size)])
+        number = max(1, 10_000 // size)
+        for backend in backends:
+            encode = serializer.get_dumps(backend)
+            serializer.dumps = encode
+            full = best_time(lambda: encode(format_response(tasks)), number=number) / size
+            fast = best_time(lambda: serializer.encode_response(tasks), number=number) / size
+            payload = len(serializer.encode_response(tasks))
+            print(f"{size:>8,} {backend:>8} {format_ns(full):>12} {format_ns(fast):>12} {payload:>12,}")
+    serializer.dumps = default
+
+
+if __name__ == "__main__":
+    main()
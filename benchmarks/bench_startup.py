@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+todo app - Startup Benchmark
+Import and app-construction cost of each worker entry point
+
+Runs every target in a fresh interpreter with `-X importtime` (in a scratch
+directory so no database or log is touched), reports the median cumulative
+import time, the wall-clock time to a ready app and the slowest imports.
+Save a run with --save and check a later one against it with --compare;
+the script exits non-zero when a target got slower than --threshold.
+
+Usage:
+    python benchmarks/bench_startup.py --save benchmark-results/startup.json
+    python benchmarks/bench_startup.py --compare benchmark-results/startup.json
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Dict, List, Tuple
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# name -> code run in the fresh interpreter
+TARGETS = {
+    "wsgi_import": "import todo_app",
+    "wsgi_app": "import todo_app; todo_app.create_app()",
+    "asgi_import": "import todo_asgi",
+}
+
+
+def parse_importtime(stderr: str) -> List[Tuple[str, int, int]]:
+    """Parse `-X importtime` output into (module, self_us, cumulative_us) rows"""
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        rows.append((name.strip(), int(self_us), int(cumulative_us)))
+    return rows
+
+
+def run_target(code: str, workdir: str) -> Tuple[float, int, List[Tuple[str, int, int]]]:
+    """
+    Run one fresh interpreter
+
+    Returns:
+        Tuple of (wall seconds, cumulative import µs of top-level project
+        modules, parsed importtime rows)
+    """
+    env = dict(os.environ, PYTHONPATH=PROJECT_ROOT)
+    start = time.perf_counter()
+    completed = subprocess.run([sys.executable, "-X", "importtime", "-c", code],
+                               cwd=workdir, env=env, capture_output=True, text=True, check=True)
+    wall = time.perf_counter() - start
+    rows = parse_importtime(completed.stderr)
+    project = sum(c for name, _, c in rows if name in ("todo_app", "todo_asgi"))
+    return wall, project, rows
+
+
+def measure(runs: int) -> Dict[str, Dict[str, object]]:
+    """Median timings per target, plus its slowest imports by self time"""
+    results = {}
+    for name, code in TARGETS.items():
+        walls, imports = [], []
+        rows: List[Tuple[str, int, int]] = []
+        with tempfile.TemporaryDirectory(prefix="todo-startup-") as workdir:
+            for _ in range(runs):
+                wall, project, rows = run_target(code, workdir)
+                walls.append(wall)
+                imports.append(project)
+        slowest = sorted(rows, key=lambda row: row[1], reverse=True)[:10]
+        results[name] = {
+            "wall_ms": round(statistics.median(walls) * 1000, 1),
+            "import_ms": round(statistics.median(imports) / 1000, 1),
+            "slowest_imports": [{"module": m, "self_ms": round(s / 1000, 2)} for m, s, _ in slowest],
+        }
+    return results
+
+
+def compare(results: Dict[str, Dict[str, object]], baseline_path: str, threshold: float) -> bool:
+    """Print per-target deltas; False if any target regressed past threshold"""
+    with open(baseline_path) as f:
+        baseline = json.load(f)["results"]
+    ok = True
+    print(f"\n📉 Compared with {baseline_path} (threshold {threshold:.0%})")
+    for name, result in results.items():
+        before = baseline.get(name)
+        if not before:
+            continue
+        change = result["wall_ms"] / before["wall_ms"] - 1
+        regressed = change > threshold
+        ok = ok and not regressed
+        print(f"{'❌' if regressed else '✅'} {name:<12} {before['wall_ms']:>8.1f} ms → {result['wall_ms']:>8.1f} ms {change:+.1%}")
+    return ok
+
+
+def main():
+    """Run the startup benchmark, then optionally save or compare a baseline"""
+    parser = argparse.ArgumentParser(description="Measure worker startup time")
+    parser.add_argument("--runs", type=int, default=5, help="Fresh interpreters per target (median is kept)")
+    parser.add_argument("--top", type=int, default=5, help="Slowest imports to print per target")
+    parser.add_argument("--save", help="Write results to this JSON file")
+    parser.add_argument("--compare", help="Baseline JSON file to compare against")
+    parser.add_argument("--threshold", type=float, default=0.15, help="Allowed slowdown (default: 0.15)")
+    args = parser.parse_args()
+
+    results = measure(args.runs)
+    print("🚀 startup cost (median)")
+    print(f"{'target':<12} {'wall':>10} {'imports':>10}")
+    for name, result in results.items():
+        print(f"{name:<12} {result['wall_ms']:>7.1f} ms {result['import_ms']:>7.1f} ms")
+        for entry in result["slowest_imports"][:args.top]:
+            print(f"    {entry['module']:<36} {entry['self_ms']:>7.2f} ms")
+
+    if args.save:
+        os.makedirs(os.path.dirname(os.path.abspath(args.save)), exist_ok=True)
+        with open(args.save, "w") as f:
+            json.dump({"python": sys.version.split()[0], "results": results}, f, indent=2)
+        print(f"📄 Baseline saved: {os.path.abspath(args.save)}")
+
+    if args.compare and not compare(results, args.compare, args.threshold):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
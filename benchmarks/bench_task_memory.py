@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""
+todo app - Task Memory Benchmark
+Memory held per task by each task representation
+
+Measures (with tracemalloc) what input_tasks dicts, a list of Task objects
+and a columnar TaskBatch retain for N tasks, including the stripped
+description strings.
+
+Usage: python benchmarks/bench_task_memory.py [N]   (default 1,000,000)
+"""
+
+import sys
+import os
+import gc
+import tracemalloc
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from modules.core import Task, input_tasks, input_task_batch
+
+
+def retained_bytes(build):
+    """Bytes still allocated after build() returns (result kept alive)"""
+    gc.collect()
+    tracemalloc.start()
+    result = build()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return current
+
+
+def main():
+    """Run the benchmark and print memory per representation"""
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    descriptions = [f"  Task number {i}  " for i in range(count)]
+    created = "2025-01-01T00:00:00.000000"
+
+    builders = [
+        ("dicts (input_tasks)", lambda: input_tasks(descriptions, created)),
+        ("Task __slots__", lambda: [Task(t["id"], t["description"], t["created"]) for t in input_tasks(descriptions, created)]),
+        ("TaskBatch (columnar)", lambda: input_task_batch(descriptions, created)),
+    ]
+
+    print(f"🧮 Memory for {count:,} tasks")
+    print(f"{'representation':<22} {'total MiB':>10} {'bytes/task':>11}")
+    for name, build in builders:
+        size = retained_bytes(build)
+        print(f"{name:<22} {size / 2**20:>10.1f} {size / count:>11.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,36 @@
+"""
+todo app - Benchmark Helpers
+Shared timing utilities for the benchmark scripts
+"""
+
+import time
+from typing import Any, Callable
+
+
+def best_time(func: Callable[[], Any], repeat: int = 5, number: int = 1) -> float:
+    """
+    Time a callable and keep the fastest run
+
+    Args:
+        func: Zero-argument callable to time
+        repeat: Number of timed runs
+        number: Calls per timed run
+
+    Returns:
+        float: Best seconds per call
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        best = min(best, (time.perf_counter() - start) / number)
+    return best
+
+
+def format_ns(seconds: float) -> str:
+    """Format a duration in seconds as nanoseconds/microseconds"""
+    ns = seconds * 1e9
+    if ns < 10_000:
+        return f"{ns:,.0f} ns"
+    return f"{ns / 1000:,.1f} µs"
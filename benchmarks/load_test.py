@@ -0,0 +1,271 @@
+#!/usr/bin/env python3
+"""
+todo app - HTTP Load Test
+Throughput and latency of the running API under concurrent load
+
+Starts the app on a scratch database (or targets --base-url), drives
+POST /api/tasks, GET /health and GET / from a pool of keep-alive clients,
+and reports throughput, p50/p95/p99 latency and server RSS. Results are
+written to benchmark-results/ tagged with the current git commit; pass
+--baseline to compare against an earlier run.
+
+Usage:
+    python benchmarks/load_test.py --concurrency 16 --requests 2000 --payload-size 50
+    python benchmarks/load_test.py --server prod --baseline benchmark-results/load_<ts>.json
+"""
+
+import argparse
+import json
+import os
+import signal
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+import requests
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of an ascending list"""
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, round(pct / 100 * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+def _proc_children(pid: int) -> List[int]:
+    """Child process ids from /proc (every thread lists the children it forked)"""
+    children = []
+    try:
+        tasks = os.listdir(f"/proc/{pid}/task")
+    except OSError:
+        return children
+    for task in tasks:
+        try:
+            with open(f"/proc/{pid}/task/{task}/children") as f:
+                children.extend(int(child) for child in f.read().split())
+        except OSError:
+            continue
+    return children
+
+
+def _proc_rss_kb(pid: int) -> Optional[int]:
+    try:
+        with open(f"/proc/{pid}/status") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1])
+    except OSError:
+        return None
+    return None
+
+
+def read_rss_kb(pid: int) -> Optional[int]:
+    """Resident set size of a process (and its children) in KiB, if readable"""
+    try:
+        import psutil
+        process = psutil.Process(pid)
+        return sum(p.memory_info().rss for p in [process] + process.children(recursive=True)) // 1024
+    except ImportError:
+        pass
+    except Exception:
+        return None
+    total = _proc_rss_kb(pid)
+    if total is None:
+        return None
+    pending = _proc_children(pid)
+    while pending:
+        child = pending.pop()
+        # A worker that exited meanwhile just has no status to read
+        total += _proc_rss_kb(child) or 0
+        pending.extend(_proc_children(child))
+    return total
+
+
+class Server:
+    """The app under test, started on a scratch directory and database"""
+
+    def __init__(self, mode: str, port: int):
+        self.mode = mode
+        self.port = port
+        self.workdir = tempfile.mkdtemp(prefix="todo-load-")
+        self.process: Optional[subprocess.Popen] = None
+
+    def __enter__(self) -> "Server":
+        with open(os.path.join(self.workdir, "config.json"), "w") as f:
+            json.dump({"port": self.port, "db_path": os.path.join(self.workdir, "tasks.db"),
+                       "log_path": os.path.join(self.workdir, "app.log")}, f)
+        env = dict(os.environ, PORT=str(self.port), PYTHONPATH=PROJECT_ROOT)
+        if self.mode == "prod":
+            command = [sys.executable, "-m", "gunicorn", "-c", os.path.join(PROJECT_ROOT, "gunicorn.conf.py"), "todo_app:app"]
+        else:
+            command = [sys.executable, os.path.join(PROJECT_ROOT, "todo_app.py")]
+        self.process = subprocess.Popen(command, cwd=self.workdir, env=env,
+                                        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        deadline = time.time() + 30
+        while time.time() < deadline:
+            try:
+                if requests.get(f"{self.base_url}/health", timeout=1).status_code == 200:
+                    return self
+            except requests.RequestException:
+                time.sleep(0.2)
+        self.__exit__()
+        raise RuntimeError("Server did not become healthy within 30s")
+
+    def __exit__(self, *exc) -> None:
+        if self.process and self.process.poll() is None:
+            self.process.send_signal(signal.SIGTERM)
+            try:
+                self.process.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                self.process.kill()
+
+    @property
+    def base_url(self) -> str:
+        return f"http://127.0.0.1:{self.port}"
+
+
+def run_scenario(base_url: str, name: str, method: str, path: str, payload: Any,
+                 concurrency: int, total: int) -> Dict[str, Any]:
+    """Fire `total` requests from `concurrency` clients and summarise them"""
+    local = threading.local()
+    latencies: List[float] = []
+    errors = 0
+    lock = threading.Lock()
+
+    def one_request(_):
+        nonlocal errors
+        session = getattr(local, "session", None)
+        if session is None:
+            session = local.session = requests.Session()
+        start = time.perf_counter()
+        try:
+            response = session.request(method, f"{base_url}{path}", json=payload, timeout=30)
+            ok = response.status_code < 400
+        except requests.RequestException:
+            ok = False
+        elapsed = time.perf_counter() - start
+        with lock:
+            latencies.append(elapsed)
+            if not ok:
+                errors += 1
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        list(pool.map(one_request, range(total)))
+    wall = time.perf_counter() - started
+    latencies.sort()
+    return {
+        "scenario": name,
+        "requests": total,
+        "errors": errors,
+        "throughput_rps": round(total / wall, 1),
+        "p50_ms": round(percentile(latencies, 50) * 1000, 2),
+        "p95_ms": round(percentile(latencies, 95) * 1000, 2),
+        "p99_ms": round(percentile(latencies, 99) * 1000, 2),
+    }
+
+
+def git_commit() -> Optional[str]:
+    """Current commit of the project, if it is a git checkout"""
+    try:
+        return subprocess.check_output(["git", "rev-parse", "--short", "HEAD"], cwd=PROJECT_ROOT,
+                                       stderr=subprocess.DEVNULL, text=True).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(results: Dict[str, Any], baseline_path: str, threshold: float) -> bool:
+    """Print deltas against a baseline run; False if any scenario regressed past threshold"""
+    with open(baseline_path) as f:
+        baseline = {s["scenario"]: s for s in json.load(f)["scenarios"]}
+    ok = True
+    print(f"\n📉 Compared with {baseline_path} (threshold {threshold:.0%})")
+    for scenario in results["scenarios"]:
+        before = baseline.get(scenario["scenario"])
+        if before is None:
+            continue
+        rps_change = scenario["throughput_rps"] / before["throughput_rps"] - 1
+        p99_change = scenario["p99_ms"] / before["p99_ms"] - 1 if before["p99_ms"] else 0.0
+        regressed = rps_change < -threshold or p99_change > threshold
+        ok = ok and not regressed
+        icon = "❌" if regressed else "✅"
+        print(f"{icon} {scenario['scenario']:<16} throughput {rps_change:+.1%}  p99 {p99_change:+.1%}")
+    return ok
+
+
+def main():
+    """Run the load test"""
+    parser = argparse.ArgumentParser(description="Load-test the todo app HTTP API")
+    parser.add_argument("--base-url", help="Target an already running server instead of starting one")
+    parser.add_argument("--server", choices=["dev", "prod"], default="dev", help="Server to start (default: dev)")
+    parser.add_argument("--port", type=int, default=5055)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--requests", type=int, default=1000, help="Requests per scenario")
+    parser.add_argument("--payload-size", type=int, default=10, help="Tasks per POST /api/tasks")
+    parser.add_argument("--output", default="benchmark-results")
+    parser.add_argument("--baseline", help="Earlier results file to compare against")
+    parser.add_argument("--threshold", type=float, default=0.10, help="Allowed regression (default: 0.10)")
+    args = parser.parse_args()
+
+    payload = {"tasks": [f"Load test task {i}" for i in range(args.payload_size)]}
+    scenarios = [
+        ("post_tasks", "POST", "/api/tasks", payload),
+        ("health", "GET", "/health", None),
+        ("home", "GET", "/", None),
+    ]
+
+    server = None if args.base_url else Server(args.server, args.port)
+    with server or _Nothing():
+        base_url = args.base_url or server.base_url
+        print(f"🔥 Load test against {base_url} (concurrency {args.concurrency}, "
+              f"{args.requests} requests/scenario, {args.payload_size} tasks/POST)")
+        results = []
+        for name, method, path, body in scenarios:
+            result = run_scenario(base_url, name, method, path, body, args.concurrency, args.requests)
+            results.append(result)
+            print(f"  {name:<12} {result['throughput_rps']:>9,.1f} req/s  p50 {result['p50_ms']:>7.2f} ms  "
+                  f"p95 {result['p95_ms']:>7.2f} ms  p99 {result['p99_ms']:>7.2f} ms  errors {result['errors']}")
+        rss_kb = read_rss_kb(server.process.pid) if server else None
+
+    report = {
+        "timestamp": datetime.now().isoformat(),
+        "commit": git_commit(),
+        "server": "external" if args.base_url else args.server,
+        "concurrency": args.concurrency,
+        "payload_size": args.payload_size,
+        "server_rss_kb": rss_kb,
+        "scenarios": results,
+    }
+    if rss_kb is not None:
+        print(f"  server RSS   {rss_kb / 1024:,.1f} MiB")
+
+    os.makedirs(args.output, exist_ok=True)
+    results_file = os.path.join(args.output, f"load_{int(time.time())}.json")
+    with open(results_file, "w") as f:
+        json.dump(report, f, indent=2)
+    print(f"📄 Results saved: {os.path.abspath(results_file)}")
+
+    if args.baseline and not compare(report, args.baseline, args.threshold):
+        sys.exit(1)
+
+
+class _Nothing:
+    """Stand-in context manager when targeting an external server"""
+
+    def __enter__(self):
+        return None
+
+    def __exit__(self, *exc):
+        return None
+
+
+if __name__ == "__main__":
+    main()
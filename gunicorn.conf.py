@@ -0,0 +1,49 @@
+"""
+todo app - Gunicorn Configuration
+Production serving settings
+
+Used by `./manage.sh start prod`. Worker and thread counts come from
+config.json, defaulting to one worker per core. `./manage.sh reload`
+runs this file again, so the config is re-read each time; a file that
+fails validation then keeps the last good settings (or the defaults, if
+it was bad from the start) instead of stopping the server.
+Each worker writes its own app log, app.<slot>.log.
+"""
+
+import multiprocessing
+
+from modules.config import ConfigError, get_config, validate_config
+from modules.log_writer import use_per_process_logs
+
+try:
+    # The master keeps imported modules across reloads, and with them this Config
+    app_config = get_config("config.json", watch=False)
+    app_config.reload()
+except ConfigError as e:
+    print(f"Warning: using default config: {e}")
+    app_config = validate_config({})
+
+bind = f"0.0.0.0:{app_config.get('port', 5000)}"
+workers = int(app_config.get("workers", multiprocessing.cpu_count()))
+threads = int(app_config.get("threads", 4))
+worker_class = "gthread"
+timeout = int(app_config.get("worker_timeout", 30))
+graceful_timeout = int(app_config.get("graceful_timeout", 30))
+keepalive = 5
+
+# Each worker imports the app itself so no SQLite connection crosses a fork
+preload_app = False
+
+accesslog = "-"
+errorlog = "-"
+
+
+def pre_fork(server, worker):
+    """Give the new worker the lowest log slot no live worker holds"""
+    taken = {getattr(other, "log_slot", None) for other in server.WORKERS.values()}
+    worker.log_slot = next(slot for slot in range(len(taken) + 1) if slot not in taken)
+
+
+def post_fork(server, worker):
+    """Give each worker its own app log (app.<slot>.log) so size rotation has one writer"""
+    use_per_process_logs(worker.log_slot)
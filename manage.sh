@@ -7,6 +7,11 @@ PROJECT_NAME="todo app"
 SERVICE_NAME="todo_app"
 PORT="5000"
 PYTHON_COMMAND="todo_app.py"
+WSGI_APP="todo_app:app"
+ASGI_APP="todo_asgi:app"
+GUNICORN_CONFIG="gunicorn.conf.py"
+# Seconds to wait for a stopping server (gunicorn drains for graceful_timeout, 30 by default)
+STOP_TIMEOUT="${STOP_TIMEOUT:-35}"
 
 show_help() {
     echo "🚀 $PROJECT_NAME Management"
@@ -14,9 +19,10 @@ show_help() {
     echo ""
     echo "Commands:"
     echo "  setup     - Set up development environment"
-    echo "  start     - Start $SERVICE_NAME"
+    echo "  start     - Start $SERVICE_NAME (dev server; 'start prod' or 'start async' for gunicorn)"
     echo "  stop      - Stop $SERVICE_NAME" 
     echo "  restart   - Restart $SERVICE_NAME"
+    echo "  reload    - Gracefully reload production workers"
     echo "  status    - Check $SERVICE_NAME status"
     echo "  logs      - View $SERVICE_NAME logs"
     echo "  clean     - Clean up temporary files"
@@ -24,6 +30,8 @@ show_help() {
     echo "Examples:"
     echo "  ./manage.sh setup"
     echo "  ./manage.sh start"
+    echo "  ./manage.sh start prod"
+    echo "  ./manage.sh start async"
 }
 
 setup_environment() {
@@ -51,7 +59,8 @@ setup_environment() {
 }
 
 start_service() {
-    echo "🚀 Starting $SERVICE_NAME..."
+    MODE="${1:-dev}"
+    echo "🚀 Starting $SERVICE_NAME ($MODE)..."
     
     # Check if already running
     if [ -f "${SERVICE_NAME}.pid" ]; then
@@ -66,8 +75,14 @@ start_service() {
         fi
     fi
     
-    # Start the service
-    .venv/bin/python $PYTHON_COMMAND &
+    # Start the service (in prod/async, PID is the gunicorn master)
+    if [ "$MODE" = "prod" ]; then
+        .venv/bin/gunicorn -c $GUNICORN_CONFIG $WSGI_APP >> "${SERVICE_NAME}.log" 2>&1 &
+    elif [ "$MODE" = "async" ]; then
+        .venv/bin/gunicorn -c $GUNICORN_CONFIG -k uvicorn_worker.UvicornWorker $ASGI_APP >> "${SERVICE_NAME}.log" 2>&1 &
+    else
+        .venv/bin/python $PYTHON_COMMAND &
+    fi
     PID=$!
     echo $PID > "${SERVICE_NAME}.pid"
     
@@ -90,6 +105,16 @@ stop_service() {
         PID=$(cat "${SERVICE_NAME}.pid")
         if ps -p $PID > /dev/null 2>&1; then
             kill $PID
+            # The master keeps the port until its workers have drained
+            WAITED=0
+            while ps -p $PID > /dev/null 2>&1; do
+                if [ $WAITED -ge $STOP_TIMEOUT ]; then
+                    echo "❌ $SERVICE_NAME (PID: $PID) still running after ${STOP_TIMEOUT}s"
+                    exit 1
+                fi
+                sleep 1
+                WAITED=$((WAITED + 1))
+            done
             rm -f "${SERVICE_NAME}.pid"
             echo "✅ $SERVICE_NAME stopped"
         else
@@ -101,6 +126,24 @@ stop_service() {
     fi
 }
 
+reload_service() {
+    echo "🔄 Reloading $SERVICE_NAME workers..."
+    
+    if [ -f "${SERVICE_NAME}.pid" ]; then
+        PID=$(cat "${SERVICE_NAME}.pid")
+        if ps -p $PID > /dev/null 2>&1; then
+            # gunicorn master re-reads its config and replaces workers gracefully
+            kill -HUP $PID
+            echo "✅ $SERVICE_NAME reloaded (PID: $PID)"
+        else
+            echo "⚠️  $SERVICE_NAME was not running"
+            rm -f "${SERVICE_NAME}.pid"
+        fi
+    else
+        echo "⚠️  No PID file found"
+    fi
+}
+
 check_status() {
     # Check port availability
     if netstat -tuln 2>/dev/null | grep -q ":$PORT "; then
@@ -146,15 +189,17 @@ case "${1:-help}" in
         setup_environment
         ;;
     start)
-        start_service
+        start_service "$2"
         ;;
     stop)
         stop_service
         ;;
     restart)
         stop_service
-        sleep 1
-        start_service
+        start_service "$2"
+        ;;
+    reload)
+        reload_service
         ;;
     status)
         check_status
@@ -0,0 +1,119 @@
+"""
+todo app - Cache Module
+Rendered-response cache with ETags
+
+This module caches fully rendered GET responses, tags them with strong
+ETags and answers If-None-Match revalidations with 304 Not Modified
+without running the view again.
+"""
+
+import functools
+import hashlib
+import time
+from typing import Any, Callable, Dict, NamedTuple, Optional, Tuple, Union
+
+from flask import Flask, Response, request
+
+
+class CachedBody(NamedTuple):
+    """A rendered response body and its validators"""
+    body: bytes
+    etag: str
+    mimetype: str
+    expires: float
+
+
+TTL = Union[None, float, Callable[[], Optional[float]]]
+
+
+class ResponseCache:
+    """
+    Rendered bodies of one app's cached views.
+
+    Each app owns one (views are registered once, on CachedViews), so
+    apps built from different configs never serve each other's bodies.
+    """
+
+    def __init__(self):
+        self._entries: Dict[str, CachedBody] = {}
+
+    def get(self, key: str, view: Callable[[], Any], ttl: TTL) -> CachedBody:
+        """
+        Get a view's rendered body, rendering it when missing or expired
+
+        Args:
+            key: View name
+            view: View function
+            ttl: See CachedViews.cached
+
+        Returns:
+            CachedBody: Current body and validators
+        """
+        entry = self._entries.get(key)
+        if entry is None or entry.expires <= time.monotonic():
+            entry = self._render(key, view, ttl)
+        return entry
+
+    def _render(self, key: str, view: Callable[[], Any], ttl: TTL) -> CachedBody:
+        """Run a view and store its rendered body"""
+        if callable(ttl):
+            ttl = ttl()
+        response = view()
+        body = response.get_data()
+        expires = float("inf") if ttl is None else time.monotonic() + ttl
+        entry = CachedBody(body, hashlib.sha1(body).hexdigest(), response.mimetype, expires)
+        self._entries[key] = entry
+        return entry
+
+
+class CachedViews:
+    """
+    Registry of views served from a ResponseCache.
+
+    Views registered with `cached()` render once and are served from memory
+    until their TTL expires (never, for static content).
+
+    Args:
+        cache: Cache to serve from; usually a proxy to the current app's
+    """
+
+    def __init__(self, cache: ResponseCache):
+        self.cache = cache
+        self._views: Dict[str, Tuple[Callable[[], Any], TTL]] = {}
+
+    def cached(self, ttl: TTL = None) -> Callable:
+        """
+        Decorator caching a view's rendered response
+
+        Args:
+            ttl: Seconds before the body is re-rendered (None: never), or a
+                callable returning them, read at each render
+
+        Returns:
+            Decorator for a Flask view function taking no arguments
+        """
+        def decorator(view: Callable[[], Any]) -> Callable[[], Response]:
+            key = view.__name__
+            self._views[key] = (view, ttl)
+
+            @functools.wraps(view)
+            def wrapper() -> Response:
+                entry = self.cache.get(key, view, ttl)
+                headers = {"ETag": f'"{entry.etag}"', "Cache-Control": "no-cache"}
+                # Weak comparison (RFC 9110): compression turns the ETag weak
+                if request.if_none_match.contains_weak(entry.etag):
+                    return Response(status=304, headers=headers)
+                return Response(entry.body, mimetype=entry.mimetype, headers=headers)
+            return wrapper
+        return decorator
+
+    def warm(self, app: Flask) -> None:
+        """
+        Pre-render every cached view into an app's cache
+
+        Args:
+            app: Flask app the views belong to
+        """
+        with app.test_request_context():
+            for key, (view, ttl) in self._views.items():
+                self.cache.get(key, view, ttl)
@@ -0,0 +1,158 @@
+"""
+todo app - Compression Module
+Negotiated response compression
+
+This module compresses response bodies with the best encoding the client
+accepts: zstd and brotli when their libraries are installed, gzip always.
+Bodies below a minimum size, streamed responses (which compress themselves,
+e.g. the task export) and already-encoded responses are sent untouched.
+"""
+
+import threading
+import zlib
+from typing import Any, Callable, Dict, List, Optional
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - optional dependency
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - optional dependency
+    zstandard = None
+
+# Mimetypes worth compressing; images, archives etc. are already dense
+COMPRESSIBLE = ("application/json", "application/x-ndjson", "text/")
+
+_local = threading.local()
+
+
+def _gzip(data: bytes, level: int) -> bytes:
+    # wbits=31: gzip container; one-shot is faster than copying a template compressobj
+    return zlib.compress(data, level, 31)
+
+
+def _brotli(data: bytes, level: int) -> bytes:
+    return brotli.compress(data, quality=level)
+
+
+def _zstd(data: bytes, level: int) -> bytes:
+    # ZstdCompressor keeps its context between calls but is not thread-safe,
+    # so each thread reuses its own, one per level
+    compressors = getattr(_local, "zstd", None)
+    if compressors is None:
+        compressors = _local.zstd = {}
+    compressor = compressors.get(level)
+    if compressor is None:
+        compressor = compressors[level] = zstandard.ZstdCompressor(level=level)
+    return compressor.compress(data)
+
+
+# Server preference when the client accepts several encodings equally
+_CODECS: Dict[str, Optional[Callable[[bytes, int], bytes]]] = {
+    "zstd": _zstd if zstandard else None,
+    "br": _brotli if brotli else None,
+    "gzip": _gzip,
+}
+
+# Config key holding each encoding's level, and its default
+LEVEL_SETTINGS = {
+    "zstd": ("compression_zstd_level", 3),
+    "br": ("compression_brotli_quality", 4),
+    "gzip": ("compression_gzip_level", 1),
+}
+
+
+def available_encodings() -> List[str]:
+    """
+    List the usable content encodings, preferred first
+
+    Returns:
+        list: Encoding names as used in Accept-Encoding
+    """
+    return [name for name, codec in _CODECS.items() if codec is not None]
+
+
+def compress(data: bytes, encoding: str, level: int) -> bytes:
+    """
+    Compress a body
+
+    Args:
+        data: Body to compress
+        encoding: One of available_encodings()
+        level: Codec-specific level (gzip 1-9, br 0-11, zstd 1-22)
+
+    Returns:
+        bytes: Encoded body
+
+    Raises:
+        ValueError: If the encoding is unknown or its library is not installed
+    """
+    codec = _CODECS.get(encoding)
+    if codec is None:
+        raise ValueError(f"Content encoding not available: {encoding}")
+    return codec(data, level)
+
+
+def negotiate(accept_encodings: Any) -> Optional[str]:
+    """
+    Pick the encoding for a request
+
+    Args:
+        accept_encodings: Parsed Accept-Encoding (werkzeug Accept); indexing
+            by name gives that encoding's quality
+
+    Returns:
+        str, or None to send the body as is
+    """
+    best, best_quality = None, 0
+    for name in available_encodings():
+        quality = accept_encodings[name]
+        if quality > best_quality:
+            best, best_quality = name, quality
+    return best
+
+
+class ResponseCompressor:
+    """
+    Flask after-request hook compressing eligible responses.
+
+    Settings are read from the config on every response, so level and
+    threshold changes apply on reload.
+
+    Args:
+        settings: Config (or mapping) providing compression_* keys
+    """
+
+    def __init__(self, settings: Any):
+        self.settings = settings
+
+    def init_app(self, app: Any) -> None:
+        """Register on an app"""
+        app.after_request(self)
+
+    def __call__(self, response: Any) -> Any:
+        from flask import request
+
+        if (response.is_streamed or response.direct_passthrough
+                or response.status_code < 200 or response.status_code in (204, 304)
+                or "Content-Encoding" in response.headers
+                or not response.mimetype.startswith(COMPRESSIBLE)):
+            return response
+        if response.content_length is None or response.content_length < int(
+                self.settings.get("compression_min_size", 1024)):
+            return response
+        response.vary.add("Accept-Encoding")
+        encoding = negotiate(request.accept_encodings)
+        if encoding is None:
+            return response
+        key, default = LEVEL_SETTINGS[encoding]
+        response.set_data(compress(response.get_data(), encoding, int(self.settings.get(key, default))))
+        response.headers["Content-Encoding"] = encoding
+        # The encoded bytes differ per encoding, so a strong validator
+        # becomes weak (If-None-Match still matches it)
+        etag, weak = response.get_etag()
+        if etag and not weak:
+            response.set_etag(etag, weak=True)
+        return response
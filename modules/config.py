@@ -0,0 +1,279 @@
+"""
+todo app - Config Module
+Cached, validated, hot-reloadable configuration
+
+This module loads config.json once, merges it over the defaults and checks
+it against a schema. A background thread watches the file's mtime and swaps
+in a new validated snapshot when it changes; a file that fails validation
+is reported and the previous snapshot stays in effect. Settings read per
+request (page sizes, batch limits, dedup mode) pick up reloads directly;
+reload listeners apply the rest (e.g. cache sizes) to live objects.
+Settings fixed at startup (port, workers, db_*, group_commit, log_*) need
+a restart.
+"""
+
+import json
+import os
+import threading
+from types import MappingProxyType
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple
+
+
+class ConfigError(ValueError):
+    """Raised when a config file cannot be parsed or fails validation"""
+
+
+DEFAULTS: Dict[str, Any] = {
+    "service_name": "todo_app",
+    "port": 5000,
+    "debug": False,
+    "db_path": "tasks.db",
+    "db_synchronous": None,
+    "group_commit": False,
+    "group_commit_max_delay_ms": 0.0,
+    "group_commit_max_tasks": 5000,
+    "ingest_chunk_size": 500,
+    "export_chunk_size": 1000,
+    "page_size": 50,
+    "max_page_size": 500,
+    "max_batch_size": 1000,
+    "dedup_mode": None,
+    "dedup_bloom_capacity": 0,
+    "health_cache_ttl": 1.0,
+    "compression_min_size": 1024,
+    "compression_gzip_level": 1,
+    "compression_brotli_quality": 4,
+    "compression_zstd_level": 3,
+    "idempotency_cache_size": 10000,
+    "idempotency_ttl": 86400,
+    "idempotency_spill_path": None,
+    "workers": os.cpu_count() or 1,
+    "threads": 4,
+    "worker_timeout": 30,
+    "graceful_timeout": 30,
+    "log_path": "app.log",
+    "log_json": False,
+    "log_max_bytes": 10 * 1024 * 1024,
+    "log_queue_size": 10000,
+    "config_reload_interval": 2.0
+}
+
+_NUMBER = (int, float)
+_OPTIONAL_STR = (str, type(None))
+
+# key -> (accepted types, range check)
+SCHEMA: Dict[str, Tuple[tuple, Optional[Callable[[Any], bool]]]] = {
+    "service_name": ((str,), None),
+    "port": ((int,), lambda v: 0 < v < 65536),
+    "debug": ((bool,), None),
+    "db_path": ((str,), None),
+    "db_synchronous": (_OPTIONAL_STR, lambda v: v is None or v.upper() in ("OFF", "NORMAL", "FULL", "EXTRA")),
+    "group_commit": ((bool,), None),
+    "group_commit_max_delay_ms": (_NUMBER, lambda v: v >= 0),
+    "group_commit_max_tasks": ((int,), lambda v: v > 0),
+    "ingest_chunk_size": ((int,), lambda v: v > 0),
+    "export_chunk_size": ((int,), lambda v: v > 0),
+    "page_size": ((int,), lambda v: v > 0),
+    "max_page_size": ((int,), lambda v: v > 0),
+    "max_batch_size": ((int,), lambda v: v > 0),
+    "dedup_mode": (_OPTIONAL_STR, lambda v: v in (None, "", "off", "skip", "merge")),
+    "dedup_bloom_capacity": ((int,), lambda v: v >= 0),
+    "health_cache_ttl": (_NUMBER, lambda v: v >= 0),
+    "compression_min_size": ((int,), lambda v: v >= 0),
+    "compression_gzip_level": ((int,), lambda v: 0 <= v <= 9),
+    "compression_brotli_quality": ((int,), lambda v: 0 <= v <= 11),
+    "compression_zstd_level": ((int,), lambda v: 1 <= v <= 22),
+    "idempotency_cache_size": ((int,), lambda v: v > 0),
+    "idempotency_ttl": (_NUMBER, lambda v: v > 0),
+    "idempotency_spill_path": (_OPTIONAL_STR, None),
+    "workers": ((int,), lambda v: v > 0),
+    "threads": ((int,), lambda v: v > 0),
+    "worker_timeout": (_NUMBER, lambda v: v > 0),
+    "graceful_timeout": (_NUMBER, lambda v: v >= 0),
+    "log_path": ((str,), None),
+    "log_json": ((bool,), None),
+    "log_max_bytes": ((int,), lambda v: v >= 0),
+    "log_queue_size": ((int,), lambda v: v > 0),
+    "config_reload_interval": (_NUMBER, lambda v: v >= 0)
+}
+
+
+def validate_config(values: Mapping[str, Any]) -> Dict[str, Any]:
+    """
+    Merge values over DEFAULTS and check them against SCHEMA
+
+    Keys not in the schema are passed through unchecked. An unset
+    db_synchronous becomes FULL with group_commit (responses wait for the
+    commit, so it must reach the disk) and NORMAL otherwise. The dedup
+    Bloom filter lives in one process and misses other writers' inserts,
+    so dedup_bloom_capacity needs workers set to 1.
+
+    Args:
+        values: Parsed config file contents
+
+    Returns:
+        Dict: Complete configuration
+
+    Raises:
+        ConfigError: If a known key has the wrong type or is out of range
+    """
+    if not isinstance(values, Mapping):
+        raise ConfigError("Config must be a JSON object")
+    merged = dict(DEFAULTS)
+    merged.update(values)
+    errors = []
+    for key, (types, check) in SCHEMA.items():
+        value = merged[key]
+        # bool is an int subclass; only accept it where bool is expected
+        if not isinstance(value, types) or (isinstance(value, bool) and bool not in types):
+            errors.append(f"{key}: expected {'/'.join(t.__name__ for t in types)}, got {type(value).__name__}")
+        elif check is not None and not check(value):
+            errors.append(f"{key}: invalid value {value!r}")
+    if not errors:
+        synchronous = merged["db_synchronous"]
+        if synchronous is None:
+            merged["db_synchronous"] = "FULL" if merged["group_commit"] else "NORMAL"
+        elif merged["group_commit"] and synchronous.upper() not in ("FULL", "EXTRA"):
+            errors.append(f"db_synchronous: group_commit needs FULL or EXTRA, got {synchronous!r}")
+        if merged["dedup_bloom_capacity"] and merged["workers"] > 1:
+            errors.append(f"dedup_bloom_capacity: needs workers set to 1, got {merged['workers']}")
+    if errors:
+        raise ConfigError("; ".join(errors))
+    return merged
+
+
+def read_config_file(config_path: str) -> Dict[str, Any]:
+    """
+    Parse and validate a config file; a missing file yields the defaults
+
+    Args:
+        config_path: Path to config file
+
+    Returns:
+        Dict: Complete configuration
+
+    Raises:
+        ConfigError: If the file cannot be parsed or fails validation
+    """
+    try:
+        with open(config_path, "r") as f:
+            values = json.load(f)
+    except FileNotFoundError:
+        return validate_config({})
+    except (OSError, ValueError) as e:
+        raise ConfigError(f"Could not load config from {config_path}: {e}") from e
+    return validate_config(values)
+
+
+class Config:
+    """
+    Cached configuration with background reload.
+
+    Reads are lock-free: the current snapshot is an immutable mapping that
+    a reload replaces in one reference assignment.
+
+    Args:
+        config_path: Path to config file
+        watch: Start the background reload thread
+    """
+
+    def __init__(self, config_path: str = "config.json", watch: bool = True):
+        self.path = config_path
+        self._values: Mapping[str, Any] = MappingProxyType(read_config_file(config_path))
+        self._stamp = self._file_stamp()
+        self._listeners: List[Callable[[Mapping[str, Any]], None]] = []
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        if watch and self._values["config_reload_interval"] > 0:
+            self._thread = threading.Thread(target=self._watch, name="config-watcher", daemon=True)
+            self._thread.start()
+
+    def __getitem__(self, key: str) -> Any:
+        return self._values[key]
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Read a setting from the current snapshot"""
+        return self._values.get(key, default)
+
+    def snapshot(self) -> Mapping[str, Any]:
+        """Current settings as a read-only mapping"""
+        return self._values
+
+    def on_reload(self, callback: Callable[[Mapping[str, Any]], None]) -> None:
+        """Call callback with the new snapshot after every successful reload"""
+        self._listeners.append(callback)
+
+    def _file_stamp(self) -> Optional[Tuple[int, int]]:
+        try:
+            stat = os.stat(self.path)
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def reload(self) -> bool:
+        """
+        Re-read the file now
+
+        Returns:
+            bool: True if a new snapshot was installed; False (keeping the
+            current one) if the file failed to parse or validate
+        """
+        try:
+            values = read_config_file(self.path)
+        except ConfigError as e:
+            print(f"Warning: keeping previous config: {e}")
+            return False
+        self._values = MappingProxyType(values)
+        for callback in self._listeners:
+            try:
+                callback(self._values)
+            except Exception as e:
+                print(f"Warning: config reload listener failed: {e}")
+        return True
+
+    def _watch(self) -> None:
+        while not self._stop.wait(self._values["config_reload_interval"] or 1.0):
+            stamp = self._file_stamp()
+            if stamp != self._stamp:
+                self._stamp = stamp
+                self.reload()
+
+    def close(self) -> None:
+        """Stop the reload thread"""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+
+
+_configs: Dict[str, Config] = {}
+_configs_lock = threading.Lock()
+
+
+def _reset_after_fork() -> None:
+    # Watcher threads do not survive fork; forked workers load their own
+    global _configs_lock
+    _configs.clear()
+    _configs_lock = threading.Lock()
+
+
+os.register_at_fork(after_in_child=_reset_after_fork)
+
+
+def get_config(config_path: str = "config.json", watch: bool = True) -> Config:
+    """
+    Get the shared Config for a path, loading it on first use
+
+    Args:
+        config_path: Path to config file
+        watch: Start the reload thread when the Config is first created
+
+    Returns:
+        Config
+    """
+    config = _configs.get(config_path)
+    if config is None:
+        with _configs_lock:
+            config = _configs.get(config_path)
+            if config is None:
+                config = _configs[config_path] = Config(config_path, watch)
+    return config
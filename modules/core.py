@@ -5,8 +5,21 @@ Core business logic
 This module contains the core business logic for todo app.
 """
 
+import csv
+import io
+import json
+import zlib
+from array import array
 from datetime import datetime
-from typing import Dict, Any
+from typing import Dict, Any, Callable, Iterable, Iterator, List, Mapping, Optional, Tuple, Union
+
+from modules.utils import get_timestamp
+from modules.storage import encode_cursor, decode_cursor
+from modules.dedup import DEDUP_MODES
+from modules.serializer import dumps
+
+EXPORT_FORMATS = {"ndjson": "application/x-ndjson", "csv": "text/csv"}
+EXPORT_COLUMNS = ("id", "description", "created", "completed")
 
 def get_status() -> Dict[str, Any]:
     """
@@ -57,23 +70,436 @@ def validate_input(data: Any) -> bool:
     return True
 
 
-def input_tasks(task_list: list[str]) -> list[dict[str, Any]]:
+def input_tasks(task_list: list[str], created: Optional[str] = None) -> list[dict[str, Any]]:
     """
     Accepts a list of task descriptions and returns a structured list of tasks.
     Each task is a dict with an id, description, and created timestamp.
+    The whole batch shares one timestamp; non-string and blank entries are skipped.
     Args:
         task_list: List of task descriptions (strings)
+        created: Timestamp stamped on every task (default: current time)
     Returns:
         List of task dicts
     """
-    from modules.utils import get_timestamp
+    if created is None:
+        created = get_timestamp()
     tasks = []
+    append = tasks.append
     for idx, desc in enumerate(task_list, 1):
-        if validate_input(desc):
-            tasks.append({
+        if not isinstance(desc, str):
+            continue
+        desc = desc.strip()
+        if desc:
+            append({
                 "id": idx,
-                "description": desc.strip(),
-                "created": get_timestamp(),
+                "description": desc,
+                "created": created,
                 "completed": False
             })
     return tasks
+
+
+class Task:
+    """
+    A single task with fixed attributes (no per-instance __dict__).
+    Serialises to the same dict shape input_tasks produces.
+    """
+
+    __slots__ = ("id", "description", "created", "completed")
+
+    def __init__(self, id: int, description: str, created: str, completed: bool = False):
+        self.id = id
+        self.description = description
+        self.created = created
+        self.completed = completed
+
+    def __repr__(self) -> str:
+        return f"Task(id={self.id!r}, description={self.description!r}, created={self.created!r}, completed={self.completed!r})"
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, Task):
+            return NotImplemented
+        return self.to_dict() == other.to_dict()
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the task as an API task dict"""
+        return {
+            "id": self.id,
+            "description": self.description,
+            "created": self.created,
+            "completed": self.completed
+        }
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> "Task":
+        """Build a Task from an API task dict"""
+        return cls(data["id"], data["description"], data["created"], bool(data["completed"]))
+
+
+class TaskBatch:
+    """
+    Columnar storage for large task sets.
+    Ids, completion flags and timestamp indexes live in typed arrays; all
+    descriptions share one string with an offsets array, and timestamps
+    are interned in a small pool (a batch usually shares one).
+    The app's own paths don't use it: POST /api/tasks, the NDJSON ingest
+    and the export all hold at most one bounded chunk of task dicts, which
+    is what TaskStore takes and returns. It is for callers that keep many
+    tasks in memory at once (see benchmarks/bench_task_memory.py).
+    """
+
+    def __init__(self):
+        self.ids = array("q")
+        self.completed = array("b")
+        self.created_index = array("I")
+        self.created_pool: List[str] = []
+        self.offsets = array("Q", [0])
+        self._text = ""
+        self._pending: List[str] = []
+        self._pool_index: Dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def append(self, id: int, description: str, created: str, completed: bool = False) -> None:
+        """Add one task to the batch"""
+        index = self._pool_index.get(created)
+        if index is None:
+            index = self._pool_index[created] = len(self.created_pool)
+            self.created_pool.append(created)
+        self.ids.append(id)
+        self.completed.append(completed)
+        self.created_index.append(index)
+        self._pending.append(description)
+        self.offsets.append(self.offsets[-1] + len(description))
+
+    def compact(self) -> None:
+        """Fold appended descriptions into the shared string pool"""
+        if self._pending:
+            self._text += "".join(self._pending)
+            self._pending = []
+
+    def _description(self, i: int) -> str:
+        self.compact()
+        return self._text[self.offsets[i]:self.offsets[i + 1]]
+
+    def __getitem__(self, i: int) -> Task:
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError("task index out of range")
+        return Task(self.ids[i], self._description(i),
+                    self.created_pool[self.created_index[i]], bool(self.completed[i]))
+
+    def __iter__(self) -> Iterator[Task]:
+        return (self[i] for i in range(len(self)))
+
+    def to_list(self) -> List[Dict[str, Any]]:
+        """Return the batch as a list of API task dicts"""
+        return [task.to_dict() for task in self]
+
+
+def input_task_batch(task_list: Iterable[Any], created: Optional[str] = None) -> TaskBatch:
+    """
+    Columnar variant of input_tasks for large task sets.
+    Applies the same validation and numbering as input_tasks.
+    Args:
+        task_list: Iterable of task descriptions (strings)
+        created: Timestamp stamped on every task (default: current time)
+    Returns:
+        TaskBatch holding the valid tasks
+    """
+    if created is None:
+        created = get_timestamp()
+    batch = TaskBatch()
+    append = batch.append
+    for idx, desc in enumerate(task_list, 1):
+        if not isinstance(desc, str):
+            continue
+        desc = desc.strip()
+        if desc:
+            append(idx, desc, created)
+    batch.compact()
+    return batch
+
+
+def parse_task_payload(data: Any) -> List[Any]:
+    """
+    Extract the task descriptions from a POST /api/tasks body.
+    Shared by the Flask and asyncio apps.
+    Args:
+        data: Decoded JSON request body
+    Returns:
+        List of raw task descriptions
+    Raises:
+        ValueError: If the body has no "tasks" list
+    """
+    tasks = data.get("tasks") if isinstance(data, dict) else None
+    if not isinstance(tasks, list):
+        raise ValueError("'tasks' must be a list")
+    return tasks
+
+
+def _is_task_id(value: Any) -> bool:
+    return isinstance(value, int) and not isinstance(value, bool) and value > 0
+
+
+def parse_dedup_mode(value: Optional[str]) -> Optional[str]:
+    """
+    Validate the dedup mode of a task creation request.
+    Args:
+        value: "skip", "merge", or None/"off"/"" for no de-duplication
+    Returns:
+        The mode, or None when de-duplication is off
+    Raises:
+        ValueError: If the mode is unknown
+    """
+    if value in (None, "", "off"):
+        return None
+    if value not in DEDUP_MODES:
+        raise ValueError(f"'dedup' must be one of: {', '.join(DEDUP_MODES)}, off")
+    return value
+
+
+def parse_batch_update(data: Any, max_batch_size: int = 1000) -> List[Dict[str, Any]]:
+    """
+    Validate a PATCH /api/tasks/batch body.
+    The batch is applied atomically, so one malformed change rejects it all.
+    Args:
+        data: Decoded JSON body {"tasks": [{"id": 1, "completed": true}, ...]}
+        max_batch_size: Largest allowed number of changes
+    Returns:
+        List of changes with an "id" and normalised "description"/"completed"
+    Raises:
+        ValueError: If the body or any change is malformed
+    """
+    items = data.get("tasks") if isinstance(data, dict) else None
+    if not isinstance(items, list):
+        raise ValueError("'tasks' must be a list")
+    if len(items) > max_batch_size:
+        raise ValueError(f"At most {max_batch_size} tasks per batch")
+    changes = []
+    for index, item in enumerate(items):
+        if not isinstance(item, dict) or not _is_task_id(item.get("id")):
+            raise ValueError(f"tasks[{index}]: 'id' must be a positive integer")
+        change: Dict[str, Any] = {"id": item["id"]}
+        if "completed" in item:
+            if not isinstance(item["completed"], bool):
+                raise ValueError(f"tasks[{index}]: 'completed' must be true or false")
+            change["completed"] = item["completed"]
+        if "description" in item:
+            description = item["description"].strip() if isinstance(item["description"], str) else ""
+            if not description:
+                raise ValueError(f"tasks[{index}]: 'description' must be a non-empty string")
+            change["description"] = description
+        if len(change) == 1:
+            raise ValueError(f"tasks[{index}]: nothing to update")
+        changes.append(change)
+    return changes
+
+
+def parse_batch_delete(data: Any, max_batch_size: int = 1000) -> List[int]:
+    """
+    Validate a DELETE /api/tasks/batch body.
+    Args:
+        data: Decoded JSON body {"ids": [1, 2, ...]}
+        max_batch_size: Largest allowed number of ids
+    Returns:
+        List of task ids
+    Raises:
+        ValueError: If the body is malformed
+    """
+    ids = data.get("ids") if isinstance(data, dict) else None
+    if not isinstance(ids, list) or not all(_is_task_id(task_id) for task_id in ids):
+        raise ValueError("'ids' must be a list of positive integers")
+    if len(ids) > max_batch_size:
+        raise ValueError(f"At most {max_batch_size} ids per batch")
+    return ids
+
+
+def parse_list_query(args: Mapping[str, str], page_size: int = 50,
+                     max_page_size: int = 500) -> Dict[str, Any]:
+    """
+    Turn GET /api/tasks query parameters into TaskStore.list_tasks arguments.
+    Shared by the Flask and asyncio apps.
+    Args:
+        args: Query parameters (completed, created_after, created_before, prefix, limit, cursor)
+        page_size: Default page size
+        max_page_size: Largest allowed page size
+    Returns:
+        Dict of keyword arguments for list_tasks
+    Raises:
+        ValueError: If a parameter is malformed
+    """
+    completed = args.get("completed")
+    if completed is not None:
+        if completed.lower() not in ("true", "false"):
+            raise ValueError("'completed' must be true or false")
+        completed = completed.lower() == "true"
+    try:
+        limit = int(args.get("limit", page_size))
+    except ValueError:
+        raise ValueError("'limit' must be an integer")
+    if not 1 <= limit <= max_page_size:
+        raise ValueError(f"'limit' must be between 1 and {max_page_size}")
+    return {
+        "completed": completed,
+        "created_after": args.get("created_after"),
+        "created_before": args.get("created_before"),
+        "prefix": args.get("prefix"),
+        "after": decode_cursor(args["cursor"]) if "cursor" in args else None,
+        "limit": limit
+    }
+
+
+def parse_search_query(args: Mapping[str, str], page_size: int = 50,
+                       max_page_size: int = 500) -> Dict[str, Any]:
+    """
+    Turn GET /api/tasks/search query parameters into TaskStore.search_tasks arguments.
+    Args:
+        args: Query parameters (q, completed, limit)
+        page_size: Default number of results
+        max_page_size: Largest allowed number of results
+    Returns:
+        Dict of keyword arguments for search_tasks
+    Raises:
+        ValueError: If a parameter is malformed
+    """
+    text = args.get("q", "").strip()
+    if not text:
+        raise ValueError("'q' is required")
+    query = parse_list_query(
+        {k: v for k, v in args.items() if k in ("completed", "limit")},
+        page_size, max_page_size
+    )
+    return {"text": text, "completed": query["completed"], "limit": query["limit"]}
+
+
+def task_page(tasks: List[Dict[str, Any]], next_key: Optional[Tuple[str, int]]) -> Dict[str, Any]:
+    """
+    Build the GET /api/tasks response data from a list_tasks result.
+    Args:
+        tasks: Tasks on this page
+        next_key: Keyset position of the last task, or None on the last page
+    Returns:
+        Dict with the tasks and the cursor for the next page
+    """
+    return {
+        "tasks": tasks,
+        "next_cursor": encode_cursor(*next_key) if next_key else None
+    }
+
+
+def ingest_task_stream(lines: Iterable[Union[str, bytes]],
+                       persist: Callable[[List[Dict[str, Any]]], List[Dict[str, Any]]],
+                       chunk_size: int = 500) -> Iterator[Dict[str, Any]]:
+    """
+    Parse NDJSON task lines and persist them in fixed-size chunks.
+    Each line is either a JSON string or an object with a "description";
+    only one chunk of descriptions is held in memory at a time.
+    Args:
+        lines: Iterable of NDJSON lines (e.g. a request stream)
+        persist: Callable storing a list of task dicts, returning the stored tasks
+        chunk_size: Number of descriptions per persisted chunk
+    Yields:
+        Acknowledgement dict per chunk with accepted/rejected counts and id range
+    """
+    chunk: List[Any] = []
+    rejected = 0
+    number = 0
+
+    def flush() -> Dict[str, Any]:
+        stored = persist(input_tasks(chunk))
+        return {
+            "chunk": number,
+            "accepted": len(stored),
+            "rejected": rejected + len(chunk) - len(stored),
+            "first_id": stored[0]["id"] if stored else None,
+            "last_id": stored[-1]["id"] if stored else None
+        }
+
+    for line in lines:
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            item = json.loads(line)
+        except ValueError:
+            rejected += 1
+            continue
+        if isinstance(item, dict):
+            item = item.get("description")
+        if not isinstance(item, str):
+            rejected += 1
+            continue
+        chunk.append(item)
+        if len(chunk) >= chunk_size:
+            number += 1
+            yield flush()
+            chunk = []
+            rejected = 0
+    if chunk or rejected:
+        number += 1
+        yield flush()
+
+
+def parse_export_query(args: Mapping[str, str]) -> Dict[str, Any]:
+    """
+    Turn GET /api/tasks/export query parameters into export settings.
+    Args:
+        args: Query parameters (format, completed, created_after, created_before, prefix)
+    Returns:
+        Dict with "format" plus the TaskStore.iter_tasks filter arguments
+    Raises:
+        ValueError: If a parameter is malformed
+    """
+    fmt = args.get("format", "ndjson").lower()
+    if fmt not in EXPORT_FORMATS:
+        raise ValueError(f"'format' must be one of: {', '.join(EXPORT_FORMATS)}")
+    query = parse_list_query({k: v for k, v in args.items() if k != "limit" and k != "cursor"})
+    del query["after"], query["limit"]
+    query["format"] = fmt
+    return query
+
+
+def export_tasks(chunks: Iterable[List[Dict[str, Any]]], fmt: str = "ndjson",
+                 compress: bool = False, level: int = 6) -> Iterator[bytes]:
+    """
+    Encode chunks of tasks as an NDJSON or CSV byte stream.
+    Only one chunk is encoded at a time; with compress, the stream is
+    gzipped on the fly and flushed after every chunk so the client keeps
+    receiving data while the export runs.
+    Args:
+        chunks: Iterable of task lists (e.g. TaskStore.iter_tasks)
+        fmt: "ndjson" or "csv"
+        compress: Gzip the stream
+        level: zlib compression level
+    Yields:
+        Encoded (and optionally compressed) pieces of the export
+    """
+    def encoded() -> Iterator[bytes]:
+        if fmt == "ndjson":
+            for chunk in chunks:
+                yield b"".join([dumps(task) + b"\n" for task in chunk])
+            return
+        buffer = io.StringIO()
+        writer = csv.writer(buffer, lineterminator="\n")
+        writer.writerow(EXPORT_COLUMNS)
+        for chunk in chunks:
+            writer.writerows([[t["id"], t["description"], t["created"], "true" if t["completed"] else "false"]
+                              for t in chunk])
+            yield buffer.getvalue().encode()
+            buffer.seek(0)
+            buffer.truncate()
+        if buffer.tell():
+            yield buffer.getvalue().encode()
+
+    if not compress:
+        yield from encoded()
+        return
+    # wbits=31: gzip container rather than a raw zlib stream
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 31)
+    for piece in encoded():
+        yield compressor.compress(piece) + compressor.flush(zlib.Z_SYNC_FLUSH)
+    yield compressor.flush()
+
@@ -0,0 +1,75 @@
+"""
+todo app - Dedup Module
+Content hashing of task descriptions
+
+This module normalises descriptions and hashes them to 64-bit digests, which
+the task store indexes to find duplicates. A fixed-size Bloom filter can sit
+in front of that index so descriptions that were never seen skip the lookup.
+"""
+
+import hashlib
+import math
+from typing import Iterable
+
+DEDUP_MODES = ("skip", "merge")
+
+
+def normalize_description(text: str) -> str:
+    """
+    Normalise a description for duplicate detection
+
+    Args:
+        text: Task description
+
+    Returns:
+        str: Case-folded text with whitespace collapsed
+    """
+    return " ".join(text.split()).casefold()
+
+
+def description_digest(text: str) -> int:
+    """
+    Hash a description's normalised form
+
+    Args:
+        text: Task description
+
+    Returns:
+        int: Signed 64-bit digest (fits an SQLite INTEGER)
+    """
+    raw = hashlib.blake2b(normalize_description(text).encode(), digest_size=8).digest()
+    return int.from_bytes(raw, "big", signed=True)
+
+
+class BloomFilter:
+    """
+    Fixed-size Bloom filter over 64-bit digests.
+
+    Memory is fixed at construction; past `capacity` items the false
+    positive rate rises, which only costs extra index lookups.
+
+    Args:
+        capacity: Expected number of digests
+        error_rate: Target false positive rate at capacity
+    """
+
+    def __init__(self, capacity: int, error_rate: float = 0.01):
+        self.size = max(8, int(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hashes = max(1, round(self.size / capacity * math.log(2)))
+        self._bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, digest: int) -> Iterable[int]:
+        # Double hashing on a Fibonacci-mixed copy of the digest, so even
+        # non-uniform integers spread across the bit array
+        mixed = (digest * 0x9E3779B97F4A7C15) & 0xFFFFFFFFFFFFFFFF
+        h1 = mixed & 0xFFFFFFFF
+        h2 = (mixed >> 32) | 1
+        return ((h1 + i * h2) % self.size for i in range(self.hashes))
+
+    def add(self, digest: int) -> None:
+        """Record a digest"""
+        for position in self._positions(digest):
+            self._bits[position >> 3] |= 1 << (position & 7)
+
+    def __contains__(self, digest: int) -> bool:
+        return all(self._bits[p >> 3] & (1 << (p & 7)) for p in self._positions(digest))
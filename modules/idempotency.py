@@ -0,0 +1,170 @@
+"""
+todo app - Idempotency Module
+Request de-duplication for retried writes
+
+This module caches the responses of requests carrying an Idempotency-Key
+so a retried request is answered from the cache instead of running again.
+Entries live in a bounded LRU with a TTL; entries evicted from memory can
+optionally spill to an SQLite file and are promoted back on their next hit.
+"""
+
+import hashlib
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, NamedTuple, Optional, Tuple
+
+
+class CachedResult(NamedTuple):
+    """A stored response for one idempotency key"""
+    fingerprint: str
+    status: int
+    body: bytes
+    expires: float
+
+
+def request_fingerprint(method: str, path: str, body: bytes) -> str:
+    """
+    Fingerprint a request so a key reused for a different request is detected
+
+    Args:
+        method: HTTP method
+        path: Request path
+        body: Raw request body
+
+    Returns:
+        str: Hex digest
+    """
+    digest = hashlib.sha256(f"{method} {path}\n".encode())
+    digest.update(body)
+    return digest.hexdigest()
+
+
+class IdempotencyCache:
+    """
+    Bounded LRU+TTL cache of responses keyed by Idempotency-Key.
+
+    Args:
+        max_entries: Entries kept in memory
+        ttl: Seconds an entry stays valid
+        spill_path: SQLite file receiving entries evicted from memory (optional)
+    """
+
+    def __init__(self, max_entries: int = 10000, ttl: float = 86400,
+                 spill_path: Optional[str] = None):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, CachedResult]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._key_locks: Dict[str, list] = {}
+        self._spill: Optional[sqlite3.Connection] = None
+        if spill_path:
+            self._spill = sqlite3.connect(spill_path, check_same_thread=False, isolation_level=None)
+            self._spill.execute("PRAGMA journal_mode=WAL")
+            self._spill.execute(
+                "CREATE TABLE IF NOT EXISTS idempotency ("
+                "key TEXT PRIMARY KEY, fingerprint TEXT, status INTEGER, body BLOB, expires REAL)"
+            )
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> Optional[CachedResult]:
+        """
+        Look up a live entry, promoting spilled entries back into memory
+
+        Args:
+            key: Idempotency key
+
+        Returns:
+            CachedResult, or None if absent or expired
+        """
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if entry.expires > now:
+                    self._entries.move_to_end(key)
+                    return entry
+                del self._entries[key]
+                return None
+            if self._spill is None:
+                return None
+            row = self._spill.execute(
+                "SELECT fingerprint, status, body, expires FROM idempotency WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            self._spill.execute("DELETE FROM idempotency WHERE key = ?", (key,))
+            entry = CachedResult(row[0], row[1], bytes(row[2]), row[3])
+            if entry.expires <= now:
+                return None
+            self._store(key, entry)
+            return entry
+
+    def put(self, key: str, fingerprint: str, status: int, body: bytes) -> None:
+        """
+        Store a response
+
+        Args:
+            key: Idempotency key
+            fingerprint: request_fingerprint of the original request
+            status: HTTP status code
+            body: Response body
+        """
+        with self._lock:
+            self._store(key, CachedResult(fingerprint, status, body, time.time() + self.ttl))
+
+    def _store(self, key: str, entry: CachedResult) -> None:
+        """Insert under the lock, evicting (and spilling) the least recently used"""
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        evicted = []
+        while len(self._entries) > self.max_entries:
+            evicted.append(self._entries.popitem(last=False))
+        if self._spill is not None and evicted:
+            now = time.time()
+            self._spill.executemany(
+                "INSERT OR REPLACE INTO idempotency VALUES (?, ?, ?, ?, ?)",
+                [(k, e.fingerprint, e.status, e.body, e.expires) for k, e in evicted if e.expires > now]
+            )
+            self._spill.execute("DELETE FROM idempotency WHERE expires <= ?", (now,))
+
+    def execute(self, key: str, fingerprint: str,
+                compute: Callable[[], Tuple[int, bytes]]) -> Tuple[int, bytes, bool]:
+        """
+        Return the cached response for key, or compute and cache it.
+        Concurrent requests with the same key wait for the first one.
+
+        Args:
+            key: Idempotency key
+            fingerprint: request_fingerprint of this request
+            compute: Produces (status, body) when there is no cached response
+
+        Returns:
+            Tuple of (status, body, replayed)
+
+        Raises:
+            ValueError: If the key was already used for a different request
+        """
+        with self._lock:
+            holder = self._key_locks.setdefault(key, [threading.Lock(), 0])
+            holder[1] += 1
+        try:
+            with holder[0]:
+                entry = self.get(key)
+                if entry is not None:
+                    if entry.fingerprint != fingerprint:
+                        raise ValueError("Idempotency-Key was already used for a different request")
+                    return entry.status, entry.body, True
+                status, body = compute()
+                # Server errors are not final; let the client retry them
+                if status < 500:
+                    self.put(key, fingerprint, status, body)
+                return status, body, False
+        finally:
+            with self._lock:
+                holder[1] -= 1
+                if not holder[1]:
+                    del self._key_locks[key]
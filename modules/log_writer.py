@@ -0,0 +1,228 @@
+"""
+todo app - Log Writer Module
+Asynchronous buffered logging
+
+This module contains the queue-backed log pipeline behind save_log: callers
+enqueue entries and a background thread writes them in batches, rotating the
+file by size and/or age. The queue is bounded; when it is full entries are
+dropped (and counted) or the caller blocks, depending on the policy.
+Rotation assumes one writer per file, so multi-process servers give each
+worker its own file (see use_per_process_logs).
+"""
+
+import atexit
+import json
+import os
+import queue
+import sys
+import threading
+import time
+from datetime import datetime
+from typing import Optional
+
+_STOP = object()
+
+
+class LogWriter:
+    """
+    Background log writer with batching, rotation and backpressure.
+
+    Args:
+        path: Log file path
+        max_queue: Maximum number of pending entries
+        batch_size: Maximum entries written per batch
+        flush_interval: Seconds the writer waits for more entries before flushing
+        max_bytes: Rotate when the file reaches this size (0: never)
+        rotate_interval: Rotate when the file is older than this many seconds (None: never)
+        backup_count: Number of rotated files kept (path.1 ... path.N)
+        json_lines: Write {"timestamp", "level", "message"} JSON lines instead of text
+        echo: Also write entries to stdout
+        policy: "drop" to discard entries when the queue is full, "block" to wait
+    """
+
+    def __init__(self, path: str = "app.log", max_queue: int = 10000, batch_size: int = 256,
+                 flush_interval: float = 0.5, max_bytes: int = 10 * 1024 * 1024,
+                 rotate_interval: Optional[float] = None, backup_count: int = 5,
+                 json_lines: bool = False, echo: bool = True, policy: str = "drop"):
+        if policy not in ("drop", "block"):
+            raise ValueError(f"Unknown log policy: {policy}")
+        self.path = path
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_bytes = max_bytes
+        self.rotate_interval = rotate_interval
+        self.backup_count = backup_count
+        self.json_lines = json_lines
+        self.echo = echo
+        self.policy = policy
+        self.dropped = 0
+        self._queue: "queue.Queue" = queue.Queue(maxsize=max_queue)
+        self._file = None
+        self._opened = 0.0
+        self._thread = threading.Thread(target=self._run, name="log-writer", daemon=True)
+        self._thread.start()
+
+    def write(self, message: str, level: str = "INFO") -> bool:
+        """
+        Enqueue a log entry
+
+        Args:
+            message: Log message
+            level: Log level (INFO, WARNING, ERROR)
+
+        Returns:
+            bool: False if the entry was dropped because the queue was full
+        """
+        entry = (datetime.now().isoformat(), level, message)
+        try:
+            if self.policy == "block":
+                self._queue.put(entry)
+            else:
+                self._queue.put_nowait(entry)
+        except queue.Full:
+            self.dropped += 1
+            return False
+        return True
+
+    def flush(self) -> None:
+        """Block until every queued entry has been written"""
+        self._queue.join()
+
+    def close(self) -> None:
+        """Write out pending entries and stop the writer thread"""
+        if self._thread.is_alive():
+            self._queue.put(_STOP)
+            self._thread.join()
+
+    def _format(self, entry: tuple) -> str:
+        timestamp, level, message = entry
+        if self.json_lines:
+            return json.dumps({"timestamp": timestamp, "level": level, "message": message})
+        return f"[{timestamp}] {level}: {message}"
+
+    def _open(self) -> None:
+        self._file = open(self.path, "a", encoding="utf-8")
+        self._opened = time.time()
+
+    def _rotate_due(self) -> bool:
+        if self.max_bytes and self._file.tell() >= self.max_bytes:
+            return True
+        return bool(self.rotate_interval) and time.time() - self._opened >= self.rotate_interval
+
+    def _rotate(self) -> None:
+        self._file.close()
+        for index in range(self.backup_count - 1, 0, -1):
+            source = f"{self.path}.{index}"
+            if os.path.exists(source):
+                os.replace(source, f"{self.path}.{index + 1}")
+        if self.backup_count:
+            os.replace(self.path, f"{self.path}.1")
+        else:
+            os.remove(self.path)
+        self._open()
+
+    def _write_batch(self, batch: list) -> None:
+        text = "\n".join(self._format(entry) for entry in batch) + "\n"
+        if self.echo:
+            sys.stdout.write(text)
+            sys.stdout.flush()
+        try:
+            if self._file is None:
+                self._open()
+            self._file.write(text)
+            self._file.flush()
+            if self._rotate_due():
+                self._rotate()
+        except OSError:
+            pass  # Silent fail for logging
+
+    def _run(self) -> None:
+        stopping = False
+        while not stopping:
+            try:
+                first = self._queue.get(timeout=self.flush_interval)
+            except queue.Empty:
+                continue
+            batch = []
+            taken = 1
+            item = first
+            while True:
+                if item is _STOP:
+                    stopping = True
+                else:
+                    batch.append(item)
+                if stopping or len(batch) >= self.batch_size:
+                    break
+                try:
+                    item = self._queue.get_nowait()
+                    taken += 1
+                except queue.Empty:
+                    break
+            if batch:
+                self._write_batch(batch)
+            for _ in range(taken):
+                self._queue.task_done()
+        if self._file is not None:
+            self._file.close()
+
+
+_writer: Optional[LogWriter] = None
+_writer_lock = threading.Lock()
+_per_process = False
+_process_slot: Optional[int] = None
+
+
+def process_log_path(path: str, slot: Optional[int] = None) -> str:
+    """
+    Insert a worker slot before the extension: app.log -> app.<slot>.log
+
+    Args:
+        path: Log file path
+        slot: Worker slot (default: the calling process id)
+
+    Returns:
+        str: Per-process log file path
+    """
+    root, ext = os.path.splitext(path)
+    return f"{root}.{os.getpid() if slot is None else slot}{ext}"
+
+
+def use_per_process_logs(slot: Optional[int] = None) -> None:
+    """
+    Make get_log_writer write to a file of this process's own.
+
+    Size rotation assumes a single writer: processes sharing one file each
+    rename it when their own handle passes max_bytes, and the others keep
+    writing into the renamed backup. Call this in every worker of a
+    multi-process server (gunicorn.conf.py does, in post_fork).
+
+    Args:
+        slot: Number the file by this instead of the process id; a worker
+            that replaces a dead one reuses its slot, and so its file,
+            rather than leaving one file behind per process ever started
+    """
+    global _per_process, _process_slot
+    _per_process = True
+    _process_slot = slot
+
+
+def get_log_writer(**options) -> LogWriter:
+    """
+    Get the process-wide log writer, starting it on first use
+
+    Args:
+        **options: LogWriter arguments (only used on first call); after
+            use_per_process_logs() the path gets the worker slot
+
+    Returns:
+        LogWriter: Shared writer, flushed automatically at interpreter exit
+    """
+    global _writer
+    if _writer is None:
+        with _writer_lock:
+            if _writer is None:
+                if _per_process:
+                    options["path"] = process_log_path(options.get("path", "app.log"), _process_slot)
+                _writer = LogWriter(**options)
+                atexit.register(_writer.close)
+    return _writer
@@ -0,0 +1,345 @@
+"""
+todo app - Metrics Module
+Request instrumentation
+
+This module records per-route latency histograms, byte counters, an
+in-flight gauge and per-stage timings, and renders them in the Prometheus
+text format. Every thread updates its own counters without locking; the
+per-thread values are only summed when /metrics is scraped.
+MetricsMiddleware feeds it from the WSGI layer.
+
+The registry lives in process memory. Under gunicorn each worker keeps its
+own, and /metrics answers with the counters of whichever worker took the
+scrape; scrape the workers separately, or sum per-worker rates, rather
+than reading one response as the server total.
+"""
+
+import threading
+import time
+from bisect import bisect_left
+from typing import Dict, List, Optional, Tuple
+
+# Histogram bucket upper bounds in seconds (the +Inf bucket is implicit)
+BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+RequestKey = Tuple[str, str, int]
+
+# Request records start with the request and response byte counts,
+# followed by the histogram. Indexes are kept non-negative: CPython only
+# specialises list subscripts for those
+_HISTOGRAM_START = 2
+_REQUEST_SUM = _HISTOGRAM_START + len(BUCKETS) + 1
+_REQUEST_COUNT = _REQUEST_SUM + 1
+
+# Fold finished threads' counters away every this many new threads, so a
+# thread-per-request server doesn't grow the list between scrapes
+_PRUNE_EVERY = 64
+
+
+def _new_histogram() -> List[float]:
+    """Bucket counts followed by the sum and the count"""
+    return [0] * (len(BUCKETS) + 1) + [0.0, 0]
+
+
+def _observe(histogram: List[float], seconds: float) -> None:
+    histogram[bisect_left(BUCKETS, seconds)] += 1
+    histogram[-2] += seconds
+    histogram[-1] += 1
+
+
+def _merge(target: Dict, source: Dict) -> None:
+    # Snapshot first: the owning thread may be adding keys concurrently
+    for key, values in list(source.items()):
+        current = target.get(key)
+        if current is None:
+            target[key] = list(values)
+        else:
+            for index, value in enumerate(values):
+                current[index] += value
+
+
+class _ThreadStats:
+    """Counters owned by a single thread"""
+
+    __slots__ = ("thread", "requests", "stages", "in_flight")
+
+    def __init__(self, thread: Optional[threading.Thread]):
+        self.thread = thread
+        self.requests: Dict[RequestKey, List[float]] = {}
+        self.stages: Dict[str, List[float]] = {}
+        self.in_flight = 0
+
+
+def _record_request(stats: _ThreadStats, route: str, method: str, status: int, seconds: float,
+                    request_bytes: int, response_bytes: int) -> None:
+    requests = stats.requests
+    key = (route, method, status)
+    record = requests.get(key)
+    if record is None:
+        record = requests[key] = [0, 0] + _new_histogram()
+    record[0] += request_bytes
+    record[1] += response_bytes
+    record[_HISTOGRAM_START + bisect_left(BUCKETS, seconds)] += 1
+    record[_REQUEST_SUM] += seconds
+    record[_REQUEST_COUNT] += 1
+
+
+class _StageTimer:
+    """Context manager timing one stage into the calling thread's stats"""
+
+    __slots__ = ("_metrics", "_stage", "_start")
+
+    def __init__(self, metrics: "Metrics", stage: str):
+        self._metrics = metrics
+        self._stage = stage
+
+    def __enter__(self) -> "_StageTimer":
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self._metrics.observe_stage(self._stage, time.perf_counter() - self._start)
+
+
+class Metrics:
+    """
+    Lock-free (per-thread) metrics registry.
+
+    Args:
+        prefix: Prefix for every exported metric name
+    """
+
+    def __init__(self, prefix: str = "todo_app"):
+        self.prefix = prefix
+        self._local = threading.local()
+        self._threads: List[_ThreadStats] = []
+        self._retired = _ThreadStats(None)
+        self._lock = threading.Lock()
+        self._registered = 0
+
+    def _stats(self) -> _ThreadStats:
+        try:
+            return self._local.stats
+        except AttributeError:
+            stats = self._local.stats = _ThreadStats(threading.current_thread())
+            with self._lock:
+                self._threads.append(stats)
+                self._registered += 1
+                if self._registered % _PRUNE_EVERY == 0:
+                    self._prune()
+            return stats
+
+    def request_started(self) -> None:
+        """Increment the in-flight gauge"""
+        self._stats().in_flight += 1
+
+    def request_finished(self) -> None:
+        """Decrement the in-flight gauge"""
+        self._stats().in_flight -= 1
+
+    def observe_request(self, route: str, method: str, status: int, seconds: float,
+                        request_bytes: int = 0, response_bytes: int = 0) -> None:
+        """
+        Record one completed request
+
+        Args:
+            route: URL rule that matched (e.g. /api/tasks)
+            method: HTTP method
+            status: Response status code
+            seconds: Handler latency
+            request_bytes: Request body size
+            response_bytes: Response body size (0 if streamed)
+        """
+        _record_request(self._stats(), route, method, status, seconds, request_bytes, response_bytes)
+
+    def observe_stage(self, stage: str, seconds: float) -> None:
+        """
+        Record the duration of a handler stage
+
+        Args:
+            stage: Stage name (validate, build, persist, serialize)
+            seconds: Stage duration
+        """
+        stats = self._stats()
+        histogram = stats.stages.get(stage)
+        if histogram is None:
+            histogram = stats.stages[stage] = _new_histogram()
+        _observe(histogram, seconds)
+
+    def stage(self, stage: str) -> _StageTimer:
+        """
+        Time a block of code as a handler stage
+
+        Args:
+            stage: Stage name
+
+        Returns:
+            Context manager recording the block's duration
+        """
+        return _StageTimer(self, stage)
+
+    def _prune(self) -> None:
+        """Fold finished threads into the retired totals (caller holds the lock)"""
+        alive = []
+        for stats in self._threads:
+            if stats.thread.is_alive():
+                alive.append(stats)
+                continue
+            _merge(self._retired.requests, stats.requests)
+            _merge(self._retired.stages, stats.stages)
+            self._retired.in_flight += stats.in_flight
+        self._threads = alive
+
+    def _collect(self) -> _ThreadStats:
+        """Sum every thread's counters, folding finished threads into the retired totals"""
+        total = _ThreadStats(None)
+        with self._lock:
+            self._prune()
+            for stats in [self._retired] + self._threads:
+                _merge(total.requests, stats.requests)
+                _merge(total.stages, stats.stages)
+                total.in_flight += stats.in_flight
+        return total
+
+    def render(self) -> str:
+        """
+        Render all metrics in the Prometheus text exposition format
+
+        Returns:
+            str: Metrics document
+        """
+        total = self._collect()
+        p = self.prefix
+        lines = [
+            f"# HELP {p}_requests_in_flight Requests currently being handled",
+            f"# TYPE {p}_requests_in_flight gauge",
+            f"{p}_requests_in_flight {total.in_flight}",
+        ]
+        lines += self._render_histogram(
+            f"{p}_request_duration_seconds", "Request latency by route",
+            {f'route="{r}",method="{m}",status="{s}"': h[_HISTOGRAM_START:] for (r, m, s), h in sorted(total.requests.items())}
+        )
+        lines += self._render_histogram(
+            f"{p}_stage_duration_seconds", "Handler stage latency",
+            {f'stage="{stage}"': h for stage, h in sorted(total.stages.items())}
+        )
+        by_route: Dict[str, List[int]] = {}
+        for (route, _, _), record in total.requests.items():
+            counters = by_route.setdefault(route, [0, 0])
+            counters[0] += record[0]
+            counters[1] += record[1]
+        for index, (name, help_text) in enumerate([
+            ("request_bytes_total", "Request body bytes by route"),
+            ("response_bytes_total", "Response body bytes by route"),
+        ]):
+            lines.append(f"# HELP {p}_{name} {help_text}")
+            lines.append(f"# TYPE {p}_{name} counter")
+            for route, counters in sorted(by_route.items()):
+                lines.append(f'{p}_{name}{{route="{route}"}} {counters[index]}')
+        return "\n".join(lines) + "\n"
+
+    @staticmethod
+    def _render_histogram(name: str, help_text: str, series: Dict[str, List[float]]) -> List[str]:
+        lines = [f"# HELP {name} {help_text}", f"# TYPE {name} histogram"]
+        for labels, histogram in series.items():
+            cumulative = 0
+            for bound, count in zip(BUCKETS + (float("inf"),), histogram):
+                cumulative += count
+                le = "+Inf" if bound == float("inf") else repr(bound)
+                lines.append(f'{name}_bucket{{{labels},le="{le}"}} {cumulative}')
+            lines.append(f"{name}_sum{{{labels}}} {histogram[-2]}")
+            lines.append(f"{name}_count{{{labels}}} {histogram[-1]}")
+        return lines
+
+
+metrics = Metrics()
+
+
+# WSGI status line -> code, so requests skip parsing it
+_STATUS_CODES: Dict[str, int] = {}
+
+
+class _ClosingBody:
+    """Streamed WSGI body that leaves the in-flight gauge when the server closes it"""
+
+    __slots__ = ("_body", "_stats")
+
+    def __init__(self, body, stats: _ThreadStats):
+        self._body = body
+        self._stats = stats
+
+    def __iter__(self):
+        return iter(self._body)
+
+    def close(self) -> None:
+        try:
+            close = getattr(self._body, "close", None)
+            if close is not None:
+                close()
+        finally:
+            self._stats.in_flight -= 1
+
+
+class MetricsMiddleware:
+    """
+    WSGI middleware recording every request into a Metrics registry.
+
+    Reads the status and sizes straight from the WSGI environ and headers
+    (no framework request context), and the route from the werkzeug request
+    the app stored in the environ. Latency runs until the response starts,
+    so streamed responses count their handler time, not the transfer; they
+    stay in flight until the server closes the body.
+
+    Args:
+        app: WSGI app to wrap
+        registry: Metrics registry (default: the module-level one)
+    """
+
+    def __init__(self, app, registry: Optional[Metrics] = None):
+        self.app = app
+        self.metrics = registry if registry is not None else metrics
+
+    def __call__(self, environ, start_response):
+        stats = self.metrics._stats()
+        stats.in_flight += 1
+        start = time.perf_counter()
+        streamed = True
+
+        def record(status, headers, exc_info=None):
+            nonlocal streamed
+            seconds = time.perf_counter() - start
+            code = _STATUS_CODES.get(status)
+            if code is None:
+                code = _STATUS_CODES[status] = int(status[:3])
+            length = 0
+            for name, value in headers:
+                # werkzeug always spells it this way
+                if name == "Content-Length":
+                    length = int(value)
+                    streamed = False
+                    break
+            # Flask drops environ["werkzeug.request"] when its request
+            # context ends, so read the route while the response starts
+            request = environ.get("werkzeug.request")
+            rule = request.url_rule if request is not None else None
+            # _record_request inlined: this runs on every request
+            key = (rule.rule if rule is not None else "<unmatched>", environ["REQUEST_METHOD"], code)
+            entry = stats.requests.get(key)
+            if entry is None:
+                entry = stats.requests[key] = [0, 0] + _new_histogram()
+            entry[0] += int(environ.get("CONTENT_LENGTH") or 0)
+            entry[1] += length
+            entry[_HISTOGRAM_START + bisect_left(BUCKETS, seconds)] += 1
+            entry[_REQUEST_SUM] += seconds
+            entry[_REQUEST_COUNT] += 1
+            return start_response(status, headers, exc_info)
+
+        try:
+            body = self.app(environ, record)
+        except BaseException:
+            stats.in_flight -= 1
+            raise
+        if streamed:
+            return _ClosingBody(body, stats)
+        stats.in_flight -= 1
+        return body
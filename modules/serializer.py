@@ -0,0 +1,161 @@
+"""
+todo app - Serializer Module
+JSON serialisation backends
+
+This module picks the fastest JSON library available (orjson, then ujson,
+then the standard library) and exposes it through one interface, plus a
+Flask JSON provider and a pre-encoded format_response envelope.
+"""
+
+import dataclasses
+import decimal
+import json
+import uuid
+from datetime import date
+from typing import Any, Callable, Dict, Optional
+
+from modules.utils import get_timestamp
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+try:
+    import ujson
+except ImportError:  # pragma: no cover - optional dependency
+    ujson = None
+
+
+def _default(obj: Any) -> Any:
+    """Encode the extra types Flask's default provider supports, plus task models"""
+    if isinstance(obj, date):
+        return obj.isoformat()
+    if isinstance(obj, (decimal.Decimal, uuid.UUID)):
+        return str(obj)
+    if hasattr(obj, "to_dict"):
+        return obj.to_dict()
+    if hasattr(obj, "to_list"):
+        return obj.to_list()
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        return dataclasses.asdict(obj)
+    if hasattr(obj, "__html__"):
+        return str(obj.__html__())
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _orjson_dumps(obj: Any) -> bytes:
+    return orjson.dumps(obj, default=_default)
+
+
+def _ujson_dumps(obj: Any) -> bytes:
+    # ujson has no default hook; fall back to the stdlib for exotic types
+    try:
+        return ujson.dumps(obj, ensure_ascii=False).encode()
+    except TypeError:
+        return _stdlib_dumps(obj)
+
+
+def _stdlib_dumps(obj: Any) -> bytes:
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"), default=_default).encode()
+
+
+_BACKENDS: Dict[str, Optional[Callable[[Any], bytes]]] = {
+    "orjson": _orjson_dumps if orjson else None,
+    "ujson": _ujson_dumps if ujson else None,
+    "json": _stdlib_dumps,
+}
+_LOADERS: Dict[str, Callable[[Any], Any]] = {
+    "orjson": orjson.loads if orjson else json.loads,
+    "ujson": ujson.loads if ujson else json.loads,
+    "json": json.loads,
+}
+
+
+def available_backends() -> list:
+    """
+    List the installed serialisation backends, fastest first
+
+    Returns:
+        list: Backend names
+    """
+    return [name for name, func in _BACKENDS.items() if func is not None]
+
+
+BACKEND = available_backends()[0]
+dumps: Callable[[Any], bytes] = _BACKENDS[BACKEND]
+loads: Callable[[Any], Any] = _LOADERS[BACKEND]
+
+
+def get_dumps(backend: str) -> Callable[[Any], bytes]:
+    """
+    Get the encoder for a named backend
+
+    Args:
+        backend: One of available_backends()
+
+    Returns:
+        Callable encoding an object to UTF-8 JSON bytes
+
+    Raises:
+        ValueError: If the backend is unknown or not installed
+    """
+    func = _BACKENDS.get(backend)
+    if func is None:
+        raise ValueError(f"JSON backend not available: {backend}")
+    return func
+
+
+# Pre-encoded envelope fragments, keyed by status
+_ENVELOPE_PREFIXES: Dict[str, bytes] = {}
+
+
+def encode_response(data: Any, status: str = "success") -> bytes:
+    """
+    Encode a format_response envelope without building the envelope dict
+
+    Args:
+        data: Response data
+        status: Response status (default: "success")
+
+    Returns:
+        bytes: JSON document equal to dumps(format_response(data, status))
+    """
+    prefix = _ENVELOPE_PREFIXES.get(status)
+    if prefix is None:
+        prefix = _ENVELOPE_PREFIXES.setdefault(
+            status, b'{"status":' + dumps(status) + b',"timestamp":"'
+        )
+    return b"".join((prefix, get_timestamp().encode(), b'","data":', dumps(data), b"}"))
+
+
+_provider_class = None
+
+
+def __getattr__(name: str) -> Any:
+    # FastJSONProvider is built on first access so importing this module
+    # (e.g. from the ASGI app) does not pull in Flask
+    global _provider_class
+    if name != "FastJSONProvider":
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    if _provider_class is None:
+        from flask.json.provider import JSONProvider
+
+        class FastJSONProvider(JSONProvider):
+            """Flask JSON provider backed by the selected serialisation backend"""
+
+            mimetype = "application/json"
+
+            def dumps(self, obj: Any, **kwargs: Any) -> str:
+                return dumps(obj).decode()
+
+            def loads(self, s: Any, **kwargs: Any) -> Any:
+                return loads(s)
+
+            def response(self, *args: Any, **kwargs: Any):
+                obj = self._prepare_response_obj(args, kwargs)
+                return self._app.response_class(dumps(obj), mimetype=self.mimetype)
+
+        FastJSONProvider.__qualname__ = "FastJSONProvider"
+        _provider_class = FastJSONProvider
+    return _provider_class
@@ -0,0 +1,739 @@
+"""
+todo app - Storage Module
+Persistent task store
+
+This module contains the SQLite-backed task store for todo app.
+The database runs in WAL mode so readers never block the writer, ids are
+allocated by AUTOINCREMENT (monotonic, never reused) and the `completed`
+and `created` columns carry secondary indexes.
+"""
+
+import base64
+import functools
+import json
+import queue
+import re
+import sqlite3
+import threading
+import time
+from typing import Dict, List, Any, Iterable, Iterator, Optional, Tuple, Union
+
+from modules.dedup import BloomFilter, description_digest, normalize_description
+
+# Schema migrations, applied in order and tracked via PRAGMA user_version
+_MIGRATIONS = [
+    """
+    CREATE TABLE IF NOT EXISTS tasks (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        description TEXT NOT NULL,
+        created TEXT NOT NULL,
+        completed INTEGER NOT NULL DEFAULT 0
+    );
+    CREATE INDEX IF NOT EXISTS idx_tasks_completed ON tasks (completed);
+    CREATE INDEX IF NOT EXISTS idx_tasks_created ON tasks (created);
+    """,
+    # Keyset pagination filtered by completion state; SQLite appends the
+    # rowid (id) to every index, so these also order ties by id
+    """
+    CREATE INDEX IF NOT EXISTS idx_tasks_completed_created ON tasks (completed, created);
+    """,
+    # Full-text index over descriptions (case-folded tokens, 2/3-char prefix
+    # indexes), kept in sync with tasks by triggers
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS tasks_fts USING fts5(
+        description, content='tasks', content_rowid='id',
+        tokenize='unicode61 remove_diacritics 2', prefix='2 3'
+    );
+    CREATE TRIGGER IF NOT EXISTS tasks_fts_insert AFTER INSERT ON tasks BEGIN
+        INSERT INTO tasks_fts (rowid, description) VALUES (new.id, new.description);
+    END;
+    CREATE TRIGGER IF NOT EXISTS tasks_fts_delete AFTER DELETE ON tasks BEGIN
+        INSERT INTO tasks_fts (tasks_fts, rowid, description) VALUES ('delete', old.id, old.description);
+    END;
+    CREATE TRIGGER IF NOT EXISTS tasks_fts_update AFTER UPDATE OF description ON tasks BEGIN
+        INSERT INTO tasks_fts (tasks_fts, rowid, description) VALUES ('delete', old.id, old.description);
+        INSERT INTO tasks_fts (rowid, description) VALUES (new.id, new.description);
+    END;
+    INSERT INTO tasks_fts (tasks_fts) VALUES ('rebuild');
+    """,
+    # Content digest of the normalised description, for duplicate detection
+    """
+    ALTER TABLE tasks ADD COLUMN digest INTEGER;
+    UPDATE tasks SET digest = task_digest(description);
+    CREATE INDEX IF NOT EXISTS idx_tasks_digest ON tasks (digest);
+    """,
+]
+
+_COLUMNS = "id, description, created, completed"
+
+
+def encode_cursor(created: str, task_id: int) -> str:
+    """
+    Encode a (created, id) keyset position as an opaque cursor
+
+    Args:
+        created: Created timestamp of the last task on the page
+        task_id: Id of the last task on the page
+
+    Returns:
+        str: URL-safe cursor
+    """
+    raw = json.dumps([created, task_id], separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[str, int]:
+    """
+    Decode a cursor produced by encode_cursor
+
+    Args:
+        cursor: Opaque cursor string
+
+    Returns:
+        Tuple of (created, id)
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        created, task_id = json.loads(raw)
+    except Exception as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
+    if not isinstance(created, str) or not isinstance(task_id, int):
+        raise ValueError(f"Invalid cursor: {cursor}")
+    return created, task_id
+
+
+def fts_query(text: str) -> str:
+    """
+    Turn free text into an FTS5 query matching every word as a prefix
+
+    Args:
+        text: User search text (e.g. "buy mil")
+
+    Returns:
+        str: FTS5 MATCH expression (e.g. '"buy"* "mil"*')
+
+    Raises:
+        ValueError: If the text contains no searchable words
+    """
+    words = re.findall(r"\w+", text)
+    if not words:
+        raise ValueError("'q' must contain at least one word")
+    return " ".join(f'"{word}"*' for word in words)
+
+
+def _statements(script: str) -> List[str]:
+    """Split a SQL script into complete statements (trigger bodies stay intact)"""
+    statements, buffer = [], ""
+    for piece in script.split(";"):
+        buffer += piece + ";"
+        if sqlite3.complete_statement(buffer):
+            if buffer.strip(" \n;"):
+                statements.append(buffer.strip())
+            buffer = ""
+    return statements
+
+
+def _row_to_task(row: tuple) -> Dict[str, Any]:
+    """Convert a tasks row into the API task dict"""
+    return {
+        "id": row[0],
+        "description": row[1],
+        "created": row[2],
+        "completed": bool(row[3])
+    }
+
+
+# PRAGMA synchronous levels. In WAL mode NORMAL syncs only at checkpoints
+# (a power cut can lose the last commits); FULL fsyncs the WAL on every commit
+SYNCHRONOUS_MODES = ("OFF", "NORMAL", "FULL", "EXTRA")
+
+
+class TaskStore:
+    """
+    SQLite task store shared by all request threads.
+
+    Each thread gets its own connection; writes are serialised through a
+    process-wide lock so concurrent requests never hit SQLITE_BUSY.
+
+    Args:
+        path: Database file path
+        synchronous: PRAGMA synchronous level (see SYNCHRONOUS_MODES)
+    """
+
+    def __init__(self, path: str = "tasks.db", synchronous: str = "NORMAL"):
+        if synchronous.upper() not in SYNCHRONOUS_MODES:
+            raise ValueError(f"Unknown synchronous mode: {synchronous}")
+        self.path = path
+        self.synchronous = synchronous.upper()
+        self._local = threading.local()
+        self._write_lock = threading.Lock()
+        self.digest_filter: Optional[BloomFilter] = None
+        self._migrate()
+
+    def _connect(self) -> sqlite3.Connection:
+        """Get (or open) the connection for the calling thread"""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, isolation_level=None, timeout=30)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(f"PRAGMA synchronous={self.synchronous}")
+            conn.create_function("task_digest", 1, description_digest, deterministic=True)
+            self._local.conn = conn
+        return conn
+
+    def _migrate(self) -> None:
+        """Bring the schema up to date"""
+        conn = self._connect()
+        with self._write_lock:
+            # Re-read the version under an exclusive lock: several worker
+            # processes may open the same database at once
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                version = conn.execute("PRAGMA user_version").fetchone()[0]
+                for number, script in enumerate(_MIGRATIONS[version:], version + 1):
+                    for statement in _statements(script):
+                        conn.execute(statement)
+                    conn.execute(f"PRAGMA user_version = {number}")
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+
+    def close(self) -> None:
+        """Close the calling thread's connection"""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+    def enable_digest_filter(self, capacity: int, error_rate: float = 0.01) -> None:
+        """
+        Put a Bloom filter of stored digests in front of the digest index.
+        Only valid when this process is the sole writer: inserts made by other
+        processes are not seen by the filter.
+
+        Args:
+            capacity: Expected number of tasks
+            error_rate: Target false positive rate at capacity
+        """
+        digest_filter = BloomFilter(capacity, error_rate)
+        with self._write_lock:
+            for (digest,) in self._connect().execute("SELECT digest FROM tasks"):
+                digest_filter.add(digest)
+            self.digest_filter = digest_filter
+
+    def _tasks_by_digest(self, conn: sqlite3.Connection,
+                         digests: Iterable[int]) -> Dict[int, Dict[str, Any]]:
+        """Oldest stored task for each digest"""
+        found: Dict[int, Dict[str, Any]] = {}
+        digests = list(digests)
+        for start in range(0, len(digests), 500):
+            chunk = digests[start:start + 500]
+            rows = conn.execute(
+                f"SELECT digest, {_COLUMNS} FROM tasks WHERE digest IN ({', '.join('?' * len(chunk))}) ORDER BY id",
+                chunk
+            )
+            for row in rows:
+                found.setdefault(row[0], _row_to_task(row[1:]))
+        return found
+
+    def insert_tasks(self, tasks: List[Dict[str, Any]],
+                     dedup: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Persist tasks in one transaction and assign their store ids
+
+        Args:
+            tasks: Task dicts as built by input_tasks (their ids are ignored)
+            dedup: None to store every task, "skip" to drop tasks whose
+                normalised description is already stored (or repeated in the
+                batch), "merge" to return the existing task in their place
+
+        Returns:
+            List of stored (or, when merging, matched) task dicts with their ids
+        """
+        if not tasks:
+            return []
+        result = self.insert_task_batches([(tasks, dedup)])[0]
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    def insert_task_batches(self, batches: List[Tuple[List[Dict[str, Any]], Optional[str]]]
+                            ) -> List[Union[List[Dict[str, Any]], Exception]]:
+        """
+        Persist several insert_tasks batches in a single transaction (one
+        commit, hence one fsync, for all of them). Each batch runs in its own
+        savepoint, so a failing batch is rolled back alone.
+
+        Args:
+            batches: (tasks, dedup) pairs, as for insert_tasks
+
+        Returns:
+            Per batch, in order: the insert_tasks result, or the exception it raised
+
+        Raises:
+            sqlite3.Error: If the transaction itself cannot be committed
+        """
+        conn = self._connect()
+        digests = [[description_digest(t["description"]) for t in tasks] for tasks, _ in batches]
+        results: List[Union[List[Dict[str, Any]], Exception]] = []
+        with self._write_lock:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                for (tasks, dedup), batch_digests in zip(batches, digests):
+                    conn.execute("SAVEPOINT batch")
+                    try:
+                        stored, rows = self._insert_batch(conn, tasks, batch_digests, dedup)
+                    except Exception as e:
+                        conn.execute("ROLLBACK TO batch")
+                        results.append(e)
+                    else:
+                        results.append(stored)
+                        # Added before commit so later batches in this
+                        # transaction see them; if the commit fails the
+                        # extra bits only cost index lookups
+                        if self.digest_filter is not None:
+                            for row in rows:
+                                self.digest_filter.add(row[3])
+                    conn.execute("RELEASE batch")
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+        return results
+
+    def _insert_batch(self, conn: sqlite3.Connection, tasks: List[Dict[str, Any]],
+                      digests: List[int], dedup: Optional[str]) -> Tuple[List[Dict[str, Any]], List[tuple]]:
+        """Insert one batch inside the caller's transaction; returns (result, inserted rows)"""
+        existing: Dict[int, Dict[str, Any]] = {}
+        if dedup:
+            candidates = set(digests)
+            if self.digest_filter is not None:
+                candidates = {d for d in candidates if d in self.digest_filter}
+            existing = self._tasks_by_digest(conn, candidates)
+        seq = conn.execute(
+            "SELECT seq FROM sqlite_sequence WHERE name = 'tasks'"
+        ).fetchone()
+        next_id = (seq[0] if seq else 0) + 1
+        rows = []
+        result = []
+        for task, digest in zip(tasks, digests):
+            match = existing.get(digest)
+            if match is not None and normalize_description(match["description"]) == normalize_description(task["description"]):
+                if dedup == "merge":
+                    result.append(match)
+                continue
+            # AUTOINCREMENT hands out consecutive ids inside an exclusive transaction
+            stored = {"id": next_id, "description": task["description"],
+                      "created": task["created"], "completed": bool(task["completed"])}
+            next_id += 1
+            rows.append((stored["description"], stored["created"], int(stored["completed"]), digest))
+            result.append(stored)
+            if dedup:
+                existing.setdefault(digest, stored)
+        conn.executemany(
+            "INSERT INTO tasks (description, created, completed, digest) VALUES (?, ?, ?, ?)",
+            rows
+        )
+        return result, rows
+
+    def update_tasks(self, changes: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Apply field changes to many tasks in one transaction
+
+        Args:
+            changes: Dicts with an "id" and new "description" and/or "completed" values
+
+        Returns:
+            Per-id results: {"id", "status": "updated", "task"} or {"id", "status": "not_found"}
+        """
+        conn = self._connect()
+        results = []
+        with self._write_lock:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                for change in changes:
+                    fields = [name for name in ("description", "completed") if name in change]
+                    values = [change[name] if name != "completed" else int(change[name]) for name in fields]
+                    digest = None
+                    if "description" in change:
+                        digest = description_digest(change["description"])
+                        fields.append("digest")
+                        values.append(digest)
+                    updated = conn.execute(
+                        f"UPDATE tasks SET {', '.join(f'{name} = ?' for name in fields)} WHERE id = ?",
+                        (*values, change["id"])
+                    ).rowcount
+                    if not updated:
+                        results.append({"id": change["id"], "status": "not_found"})
+                        continue
+                    # As in insert_task_batches: a digest missing from the
+                    # filter would let duplicates of the new text through
+                    if digest is not None and self.digest_filter is not None:
+                        self.digest_filter.add(digest)
+                    row = conn.execute(
+                        f"SELECT {_COLUMNS} FROM tasks WHERE id = ?", (change["id"],)
+                    ).fetchone()
+                    results.append({"id": change["id"], "status": "updated", "task": _row_to_task(row)})
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+        return results
+
+    def delete_tasks(self, task_ids: List[int]) -> List[Dict[str, Any]]:
+        """
+        Delete many tasks in one transaction
+
+        Args:
+            task_ids: Ids of the tasks to delete
+
+        Returns:
+            Per-id results: {"id", "status": "deleted" or "not_found"}
+        """
+        conn = self._connect()
+        results = []
+        with self._write_lock:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                for task_id in task_ids:
+                    deleted = conn.execute("DELETE FROM tasks WHERE id = ?", (task_id,)).rowcount
+                    results.append({"id": task_id, "status": "deleted" if deleted else "not_found"})
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+        return results
+
+    def get_task(self, task_id: int) -> Optional[Dict[str, Any]]:
+        """
+        Look up a task by primary key
+
+        Args:
+            task_id: Task id
+
+        Returns:
+            Task dict, or None if no such task exists
+        """
+        row = self._connect().execute(
+            f"SELECT {_COLUMNS} FROM tasks WHERE id = ?", (task_id,)
+        ).fetchone()
+        return _row_to_task(row) if row else None
+
+    def list_tasks(self, completed: Optional[bool] = None,
+                   created_after: Optional[str] = None,
+                   created_before: Optional[str] = None,
+                   prefix: Optional[str] = None,
+                   after: Optional[Tuple[str, int]] = None,
+                   limit: int = 50) -> Tuple[List[Dict[str, Any]], Optional[Tuple[str, int]]]:
+        """
+        List tasks ordered by (created, id) using keyset pagination
+
+        Args:
+            completed: Only tasks with this completion state (optional)
+            created_after: Only tasks created strictly after this timestamp (optional)
+            created_before: Only tasks created strictly before this timestamp (optional)
+            prefix: Only tasks whose description starts with this text, case-insensitive (optional)
+            after: (created, id) of the last task on the previous page (optional)
+            limit: Maximum number of tasks to return
+
+        Returns:
+            Tuple of (tasks, key of the last task or None when there are no more pages)
+        """
+        clauses = []
+        params: List[Any] = []
+        if completed is not None:
+            clauses.append("completed = ?")
+            params.append(int(completed))
+        if created_after is not None:
+            clauses.append("created > ?")
+            params.append(created_after)
+        if created_before is not None:
+            clauses.append("created < ?")
+            params.append(created_before)
+        if prefix:
+            escaped = prefix.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+            clauses.append("description LIKE ? ESCAPE '\\'")
+            params.append(escaped + "%")
+        if after is None:
+            where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+            sql = f"SELECT {_COLUMNS} FROM tasks {where} ORDER BY created, id LIMIT ?"
+            args = (*params, limit + 1)
+        else:
+            # SQLite only seeks on `created` for a row-value (created, id) > (?, ?)
+            # and then scans every task sharing that timestamp; a POST batch
+            # shares one, so split into two seeks: the rest of the tie, then
+            # later timestamps
+            filters = "".join(f"{clause} AND " for clause in clauses)
+            sql = (
+                f"SELECT * FROM (SELECT {_COLUMNS} FROM tasks WHERE {filters}created = ? AND id > ? "
+                f"ORDER BY id LIMIT ?) UNION ALL "
+                f"SELECT * FROM (SELECT {_COLUMNS} FROM tasks WHERE {filters}created > ? "
+                f"ORDER BY created, id LIMIT ?) ORDER BY created, id LIMIT ?"
+            )
+            args = (*params, *after, limit + 1, *params, after[0], limit + 1, limit + 1)
+        rows = self._connect().execute(sql, args).fetchall()
+        tasks = [_row_to_task(row) for row in rows[:limit]]
+        next_key = (tasks[-1]["created"], tasks[-1]["id"]) if len(rows) > limit else None
+        return tasks, next_key
+
+    def iter_tasks(self, chunk_size: int = 1000, **filters: Any) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Walk every matching task in (created, id) order, one chunk at a time
+
+        Each chunk is a separate keyset query, so no read transaction stays
+        open for the whole walk (which would stop WAL checkpoints); tasks
+        added or changed meanwhile may or may not be included.
+
+        Args:
+            chunk_size: Tasks per chunk
+            **filters: completed, created_after, created_before, prefix (see list_tasks)
+
+        Yields:
+            Lists of up to chunk_size tasks
+        """
+        after = None
+        while True:
+            tasks, after = self.list_tasks(after=after, limit=chunk_size, **filters)
+            if tasks:
+                yield tasks
+            if after is None:
+                return
+
+    def search_tasks(self, text: str, completed: Optional[bool] = None,
+                     limit: int = 50) -> List[Dict[str, Any]]:
+        """
+        Full-text search over task descriptions
+
+        Args:
+            text: Search text; every word must match a word prefix, case-insensitively
+            completed: Only tasks with this completion state (optional)
+            limit: Maximum number of tasks to return
+
+        Returns:
+            Matching tasks, best match first
+
+        Raises:
+            ValueError: If the text contains no searchable words
+        """
+        sql = (
+            "SELECT t.id, t.description, t.created, t.completed FROM tasks_fts "
+            "JOIN tasks t ON t.id = tasks_fts.rowid WHERE tasks_fts MATCH ?"
+        )
+        params: List[Any] = [fts_query(text)]
+        if completed is not None:
+            sql += " AND t.completed = ?"
+            params.append(int(completed))
+        rows = self._connect().execute(
+            sql + " ORDER BY tasks_fts.rank LIMIT ?", (*params, limit)
+        ).fetchall()
+        return [_row_to_task(row) for row in rows]
+
+    def count(self, completed: Optional[bool] = None) -> int:
+        """
+        Count stored tasks
+
+        Args:
+            completed: Only count tasks with this completion state (optional)
+
+        Returns:
+            int: Number of matching tasks
+        """
+        conn = self._connect()
+        if completed is None:
+            return conn.execute("SELECT COUNT(*) FROM tasks").fetchone()[0]
+        return conn.execute(
+            "SELECT COUNT(*) FROM tasks WHERE completed = ?", (int(completed),)
+        ).fetchone()[0]
+
+
+class AsyncTaskStore:
+    """
+    asyncio adapter for TaskStore.
+
+    SQLite has no non-blocking API, so every call runs on a small dedicated
+    thread pool and the event loop only awaits the result.
+    """
+
+    def __init__(self, store: TaskStore, max_workers: int = 4):
+        # Imported here: only the ASGI app needs them, and asyncio is slow to load
+        from concurrent.futures import ThreadPoolExecutor
+        self.store = store
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="task-store")
+
+    async def _run(self, func, *args: Any, **kwargs: Any) -> Any:
+        """Run a blocking store call on the executor"""
+        import asyncio
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, functools.partial(func, *args, **kwargs))
+
+    async def insert_tasks(self, tasks: List[Dict[str, Any]],
+                           dedup: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Async TaskStore.insert_tasks"""
+        return await self._run(self.store.insert_tasks, tasks, dedup)
+
+    async def update_tasks(self, changes: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Async TaskStore.update_tasks"""
+        return await self._run(self.store.update_tasks, changes)
+
+    async def delete_tasks(self, task_ids: List[int]) -> List[Dict[str, Any]]:
+        """Async TaskStore.delete_tasks"""
+        return await self._run(self.store.delete_tasks, task_ids)
+
+    async def get_task(self, task_id: int) -> Optional[Dict[str, Any]]:
+        """Async TaskStore.get_task"""
+        return await self._run(self.store.get_task, task_id)
+
+    async def list_tasks(self, **kwargs: Any) -> Tuple[List[Dict[str, Any]], Optional[Tuple[str, int]]]:
+        """Async TaskStore.list_tasks"""
+        return await self._run(self.store.list_tasks, **kwargs)
+
+    async def search_tasks(self, text: str, completed: Optional[bool] = None,
+                           limit: int = 50) -> List[Dict[str, Any]]:
+        """Async TaskStore.search_tasks"""
+        return await self._run(self.store.search_tasks, text, completed, limit)
+
+    async def count(self, completed: Optional[bool] = None) -> int:
+        """Async TaskStore.count"""
+        return await self._run(self.store.count, completed)
+
+    def close(self) -> None:
+        """Shut down the executor threads"""
+        self._executor.shutdown(wait=True)
+
+
+class _PendingInsert:
+    """One insert_tasks call waiting for its group to commit"""
+
+    __slots__ = ("tasks", "dedup", "done", "result")
+
+    def __init__(self, tasks: List[Dict[str, Any]], dedup: Optional[str]):
+        self.tasks = tasks
+        self.dedup = dedup
+        self.done = threading.Event()
+        self.result: Union[List[Dict[str, Any]], BaseException, None] = None
+
+
+_STOP = object()
+
+
+class GroupCommitter:
+    """
+    Group commit for TaskStore.insert_tasks.
+
+    Callers enqueue their batch and block; a committer thread gathers the
+    batches queued within a window and writes them with
+    TaskStore.insert_task_batches, so many requests share one commit and
+    one fsync of the SQLite WAL. A call returns only after its group has
+    committed, which means durably only with synchronous=FULL or EXTRA
+    (config enforces this when group_commit is on).
+
+    Args:
+        store: Task store to write to
+        max_delay: Seconds the committer waits for more batches after the
+            first one arrives. 0 commits whatever is queued; batches that
+            arrive during a commit still form the next group, which is
+            usually best when writers are busy
+        max_tasks: Commit early once a group holds this many tasks
+    """
+
+    def __init__(self, store: TaskStore, max_delay: float = 0.0, max_tasks: int = 5000):
+        self.store = store
+        self.max_delay = max_delay
+        self.max_tasks = max_tasks
+        self.groups = 0
+        self._queue: "queue.Queue" = queue.Queue()
+        # Orders enqueues against close(), so nothing is queued behind _STOP
+        self._lock = threading.Lock()
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name="group-commit", daemon=True)
+        self._thread.start()
+
+    def insert_tasks(self, tasks: List[Dict[str, Any]],
+                     dedup: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Same contract as TaskStore.insert_tasks, committed with other callers' batches
+
+        Raises:
+            RuntimeError: If the committer has been closed
+        """
+        if not tasks:
+            return []
+        pending = _PendingInsert(tasks, dedup)
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("Group committer is closed")
+            self._queue.put(pending)
+        pending.done.wait()
+        if isinstance(pending.result, BaseException):
+            raise pending.result
+        return pending.result
+
+    def _gather(self, first: _PendingInsert) -> Tuple[List[_PendingInsert], bool]:
+        """Collect the group started by first; also reports whether close() was called"""
+        group = [first]
+        size = len(first.tasks)
+        deadline = time.monotonic() + self.max_delay
+        while size < self.max_tasks:
+            remaining = deadline - time.monotonic()
+            try:
+                item = self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is _STOP:
+                return group, True
+            group.append(item)
+            size += len(item.tasks)
+        return group, False
+
+    def _run(self) -> None:
+        stopping = False
+        while not stopping:
+            first = self._queue.get()
+            if first is _STOP:
+                break
+            group, stopping = self._gather(first)
+            try:
+                results = self.store.insert_task_batches([(p.tasks, p.dedup) for p in group])
+            except BaseException as e:
+                results = [e] * len(group)
+            self.groups += 1
+            for pending, result in zip(group, results):
+                pending.result = result
+                pending.done.set()
+
+    def close(self) -> None:
+        """Commit what is queued, then stop the committer thread; later inserts raise"""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._queue.put(_STOP)
+        self._thread.join()
+
+
+_store: Optional[TaskStore] = None
+_store_lock = threading.Lock()
+
+
+def get_store(path: str = "tasks.db", synchronous: str = "NORMAL") -> TaskStore:
+    """
+    Get the process-wide task store, opening it on first use. The ASGI app
+    uses this; each Flask app from create_app opens its own TaskStore.
+
+    Args:
+        path: Database file path (only used on first call)
+        synchronous: PRAGMA synchronous level (only used on first call)
+
+    Returns:
+        TaskStore: Shared store instance
+    """
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                _store = TaskStore(path, synchronous)
+    return _store
@@ -5,10 +5,12 @@ Utility functions
 This module contains utility functions for todo app.
 """
 
-import json
-import os
+import re
 from datetime import datetime
-from typing import Dict, List, Any, Optional
+from typing import Dict, Iterable, List, Any, Optional
+
+from modules.config import ConfigError, get_config, validate_config
+from modules.log_writer import get_log_writer
 
 def get_timestamp() -> str:
     """
@@ -40,6 +42,9 @@ def load_config(config_path: str = "config.json") -> Dict[str, Any]:
     """
     Load configuration from file
     
+    The file is parsed once and cached (see modules.config); later calls
+    return the current snapshot, including background reloads.
+    
     Args:
         config_path: Path to config file
         
@@ -47,37 +52,26 @@ def load_config(config_path: str = "config.json") -> Dict[str, Any]:
         Dict: Configuration data
     """
     try:
-        if os.path.exists(config_path):
-            with open(config_path, 'r') as f:
-                return json.load(f)
-    except Exception as e:
-        print(f"Warning: Could not load config from {config_path}: {e}")
-    
-    # Return default config
-    return {
-        "service_name": "todo_app",
-        "port": 5000,
-        "debug": False
-    }
+        return dict(get_config(config_path).snapshot())
+    except ConfigError as e:
+        print(f"Warning: {e}")
+        return validate_config({})
 
 def save_log(message: str, level: str = "INFO") -> None:
     """
     Save log message
     
+    Entries are queued and written in batches by a background thread
+    (see modules.log_writer); this call never touches the file itself.
+    
     Args:
         message: Log message
         level: Log level (INFO, WARNING, ERROR)
     """
-    timestamp = get_timestamp()
-    log_entry = f"[{timestamp}] {level}: {message}"
-    print(log_entry)
-    
-    # Optionally save to file
-    try:
-        with open("app.log", "a") as f:
-            f.write(log_entry + "\n")
-    except Exception:
-        pass  # Silent fail for logging
+    get_log_writer().write(message, level)
+
+# Characters unsafe in filenames on common filesystems
+_UNSAFE_FILENAME_CHARS = re.compile(r'[<>:"/\\|?*]')
 
 def sanitize_filename(filename: str) -> str:
     """
@@ -89,7 +83,41 @@ def sanitize_filename(filename: str) -> str:
     Returns:
         str: Sanitized filename
     """
-    import re
     # Remove or replace unsafe characters
-    sanitized = re.sub(r'[<>:"/\\|?*]', '_', filename)
-    return sanitized.strip()
+    return _UNSAFE_FILENAME_CHARS.sub('_', filename).strip()
+
+def sanitize_filenames(filenames: Iterable[str]) -> List[str]:
+    """
+    Sanitize a batch of filenames, keeping them unique
+    
+    Names that collide after sanitising (compared case-insensitively, as on
+    Windows and macOS filesystems) get a " (n)" suffix before the extension.
+    
+    Args:
+        filenames: Original filenames
+        
+    Returns:
+        List: Sanitized filenames, in input order
+    """
+    sub = _UNSAFE_FILENAME_CHARS.sub
+    taken = set()
+    counters: Dict[str, int] = {}
+    result = []
+    for filename in filenames:
+        name = sub('_', filename).strip()
+        key = name.casefold()
+        if key in taken:
+            stem, dot, ext = name.rpartition(".")
+            if not stem:
+                stem, dot, ext = name, "", ""
+            n = counters.get(key, 1)
+            while True:
+                candidate = f"{stem} ({n}){dot}{ext}"
+                n += 1
+                if candidate.casefold() not in taken:
+                    break
+            counters[key] = n
+            name, key = candidate, candidate.casefold()
+        taken.add(key)
+        result.append(name)
+    return result
@@ -0,0 +1,69 @@
+"""
+todo app - Test HTTP Client
+Shared keep-alive session for the test runners
+
+Every test phase goes through one requests.Session so checks reuse pooled
+TCP connections instead of opening one per request. Connection errors and
+gateway errors (502/503/504) on idempotent requests are retried with
+exponential backoff. Tuned through environment variables:
+
+    TEST_BASE_URL        Target server (default: http://localhost:5000)
+    TEST_HTTP_POOL_SIZE  Connections kept per host (default: 32)
+    TEST_HTTP_RETRIES    Retries per request (default: 3)
+    TEST_HTTP_BACKOFF    Backoff factor in seconds (default: 0.2)
+"""
+
+import os
+import threading
+from typing import Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+BASE_URL = os.environ.get("TEST_BASE_URL", "http://localhost:5000").rstrip("/")
+
+_session: Optional[requests.Session] = None
+_lock = threading.Lock()
+
+
+def create_session(pool_size: Optional[int] = None, retries: Optional[int] = None,
+                   backoff: Optional[float] = None) -> requests.Session:
+    """
+    Build a pooled session with retry/backoff
+
+    Args:
+        pool_size: Connections kept per host (default: TEST_HTTP_POOL_SIZE)
+        retries: Retries per request (default: TEST_HTTP_RETRIES)
+        backoff: Backoff factor in seconds (default: TEST_HTTP_BACKOFF)
+
+    Returns:
+        requests.Session
+    """
+    pool_size = pool_size if pool_size is not None else int(os.environ.get("TEST_HTTP_POOL_SIZE", 32))
+    retries = retries if retries is not None else int(os.environ.get("TEST_HTTP_RETRIES", 3))
+    backoff = backoff if backoff is not None else float(os.environ.get("TEST_HTTP_BACKOFF", 0.2))
+    # Status retries only apply to idempotent methods (urllib3's default
+    # allowed_methods), so a POST is never replayed after reaching the app
+    retry = Retry(total=retries, backoff_factor=backoff, status_forcelist=(502, 503, 504),
+                  raise_on_status=False)
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=pool_size, max_retries=retry)
+    session = requests.Session()
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def get_session() -> requests.Session:
+    """
+    Get the process-wide session, creating it on first use
+
+    Returns:
+        requests.Session shared by all test phases (safe to use from threads)
+    """
+    global _session
+    if _session is None:
+        with _lock:
+            if _session is None:
+                _session = create_session()
+    return _session
@@ -6,11 +6,12 @@ Fast development testing for immediate feedback
 
 import sys
 import os
-import requests
 
 # Add project root to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+from tests.http_client import BASE_URL, get_session
+
 def quick_backend_test():
     """Test core backend functions"""
     try:
@@ -27,7 +28,8 @@ def quick_backend_test():
 
 def quick_api_test():
     """Test core API endpoints"""
-    base_url = "http://localhost:5000"
+    base_url = BASE_URL
+    http = get_session()
     
     endpoints = [
         "/health",
@@ -36,7 +38,7 @@ def quick_api_test():
     
     for endpoint in endpoints:
         try:
-            response = requests.get(f"{base_url}{endpoint}", timeout=5)
+            response = http.get(f"{base_url}{endpoint}", timeout=5)
             if response.status_code == 200:
                 print(f"✅ {endpoint}")
             else:
@@ -50,7 +52,8 @@ def quick_api_test():
 
 def quick_frontend_test():
     """Test core frontend pages"""
-    base_url = "http://localhost:5000"
+    base_url = BASE_URL
+    http = get_session()
     
     pages = [
         "/",
@@ -59,7 +62,7 @@ def quick_frontend_test():
     
     for page in pages:
         try:
-            response = requests.get(f"{base_url}{page}", timeout=5)
+            response = http.get(f"{base_url}{page}", timeout=5)
             if response.status_code == 200:
                 print(f"✅ {page}")
             else:
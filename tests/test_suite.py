@@ -4,16 +4,475 @@ todo app - Comprehensive Testing Suite
 Template for 4-phase testing methodology
 """
 
+import argparse
 import sys
 import os
-import requests
 import json
+import shutil
+import tempfile
+import threading
+import uuid
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, List, Tuple, Any
+from typing import Callable, Dict, List, Tuple, Any
 
 # Add project root to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+from modules.config import read_config_file
+from modules.metrics import Metrics
+from modules.storage import TaskStore
+from tests.http_client import BASE_URL, get_session
+
+# Phase 1 backend tests (DRY configuration - customize for your project)
+BACKEND_TESTS = {
+    "core_function": {
+        "description": "Test core functionality",
+        "module": "modules.core",
+        "function": "get_status",
+        "assertions": [
+            "assert 'status' in result",
+            "assert result['status'] == 'running'"
+        ]
+    },
+    "input_tasks_basic": {
+        "description": "Test input_tasks with a simple list of tasks",
+        "module": "modules.core",
+        "function": "input_tasks",
+        "args": [["Buy milk", "Read book", "Write code"]],
+        "assertions": [
+            "assert isinstance(result, list)",
+            "assert len(result) == 3",
+            "assert result[0]['description'] == 'Buy milk'",
+            "assert result[1]['id'] == 2",
+            "assert result[2]['completed'] is False"
+        ]
+    },
+    "input_tasks_empty": {
+        "description": "Test input_tasks with an empty list",
+        "module": "modules.core",
+        "function": "input_tasks",
+        "args": [[]],
+        "assertions": [
+            "assert isinstance(result, list)",
+            "assert len(result) == 0"
+        ]
+    },
+    "input_tasks_invalid": {
+        "description": "Test input_tasks with invalid/blank tasks",
+        "module": "modules.core",
+        "function": "input_tasks",
+        "args": [["", None, "  ", "Task"]],
+        "assertions": [
+            "assert isinstance(result, list)",
+            "assert len(result) == 1",
+            "assert result[0]['description'] == 'Task'"
+        ]
+    },
+    "input_tasks_batch_timestamp": {
+        "description": "Test input_tasks stamps one timestamp per batch and skips non-strings",
+        "module": "modules.core",
+        "function": "input_tasks",
+        "args": [["  A  ", 42, "B"], "2025-01-01T00:00:00"],
+        "assertions": [
+            "assert [t['description'] for t in result] == ['A', 'B']",
+            "assert [t['id'] for t in result] == [1, 3]",
+            "assert {t['created'] for t in result} == {'2025-01-01T00:00:00'}"
+        ]
+    },
+    "input_task_batch_columnar": {
+        "description": "Test input_task_batch matches input_tasks in columnar form",
+        "module": "modules.core",
+        "function": "input_task_batch",
+        "args": [["  A  ", None, "", "B"], "2025-01-01T00:00:00"],
+        "assertions": [
+            "assert len(result) == 2",
+            "assert result[1].id == 4 and result[1].description == 'B'",
+            "assert result.to_list() == [{'id': 1, 'description': 'A', 'created': '2025-01-01T00:00:00', 'completed': False}, {'id': 4, 'description': 'B', 'created': '2025-01-01T00:00:00', 'completed': False}]",
+            "assert result.created_pool == ['2025-01-01T00:00:00']"
+        ]
+    },
+    "parse_list_query_basic": {
+        "description": "Test parse_list_query maps query params to list_tasks arguments",
+        "module": "modules.core",
+        "function": "parse_list_query",
+        "args": [{"completed": "TRUE", "limit": "5", "prefix": "Buy"}],
+        "assertions": [
+            "assert result['completed'] is True",
+            "assert result['limit'] == 5",
+            "assert result['prefix'] == 'Buy'",
+            "assert result['after'] is None"
+        ]
+    },
+    "log_writer_queue": {
+        "description": "Test LogWriter queues, flushes and stops cleanly",
+        "module": "modules.log_writer",
+        "function": "LogWriter",
+        "args": [os.devnull, 10, 256, 0.5, 0, None, 0, True, False],
+        "assertions": [
+            "assert result.write('entry') is True",
+            "assert result.flush() is None and result.dropped == 0",
+            "assert result.close() is None and not result._thread.is_alive()"
+        ]
+    },
+    "process_log_path": {
+        "description": "Test process_log_path puts the worker slot (or process id) before the extension",
+        "module": "modules.log_writer",
+        "function": "process_log_path",
+        "args": ["logs/app.log", 2],
+        "assertions": [
+            "assert result == 'logs/app.2.log'",
+            "assert __import__('modules.log_writer', fromlist=['process_log_path']).process_log_path('app') == f'app.{os.getpid()}'"
+        ]
+    },
+    "metrics_render": {
+        "description": "Test Metrics records requests and renders Prometheus text",
+        "module": "modules.metrics",
+        "function": "Metrics",
+        "args": ["test"],
+        "assertions": [
+            "assert result.observe_request('/api/tasks', 'POST', 200, 0.002, 10, 20) is None",
+            "assert 'test_request_duration_seconds_count{route=\"/api/tasks\",method=\"POST\",status=\"200\"} 1' in result.render()",
+            "assert 'test_response_bytes_total{route=\"/api/tasks\"} 20' in result.render()",
+            "assert 'test_requests_in_flight 0' in result.render()"
+        ]
+    },
+    "metrics_middleware_stream": {
+        "description": "Test MetricsMiddleware keeps a streamed response in flight until it is closed",
+        "module": "modules.metrics",
+        "function": "MetricsMiddleware",
+        "args": lambda: [ndjson_app, Metrics("stream")],
+        "assertions": [
+            "assert stream_response(result) == (b'a\\nb\\n', 1, 0)",
+            "assert 'stream_requests_in_flight 0' in result.metrics.render()",
+            "assert 'stream_request_duration_seconds_count{route=\"<unmatched>\",method=\"GET\",status=\"200\"} 1' in result.metrics.render()"
+        ]
+    },
+    "metrics_prune_threads": {
+        "description": "Test Metrics folds finished threads away without waiting for a scrape",
+        "module": "modules.metrics",
+        "function": "Metrics",
+        "args": ["prune"],
+        "assertions": [
+            "assert observe_from_threads(result, 200) <= 64",
+            "assert 'prune_request_duration_seconds_count{route=\"/api/tasks\",method=\"GET\",status=\"200\"} 200' in result.render()"
+        ]
+    },
+    "idempotency_cache_replay": {
+        "description": "Test IdempotencyCache replays the first response and evicts LRU entries",
+        "module": "modules.idempotency",
+        "function": "IdempotencyCache",
+        "args": [2, 60],
+        "assertions": [
+            "assert result.execute('k1', 'f', lambda: (200, b'first')) == (200, b'first', False)",
+            "assert result.execute('k1', 'f', lambda: (200, b'second')) == (200, b'first', True)",
+            "assert result.execute('k2', 'f', lambda: (500, b'oops')) == (500, b'oops', False) and result.get('k2') is None",
+            "assert result.put('k3', 'f', 200, b'') is None and result.put('k4', 'f', 200, b'') is None",
+            "assert result.get('k1') is None and len(result) == 2"
+        ]
+    },
+    "task_store_insert": {
+        "description": "Test TaskStore allocates monotonic ids and supports lookup",
+        "module": "modules.storage",
+        "function": "TaskStore",
+        "args": [":memory:"],
+        "assertions": [
+            "assert [t['id'] for t in result.insert_tasks([{'description': 'A', 'created': 't1', 'completed': False}] * 2)] == [1, 2]",
+            "assert [t['id'] for t in result.insert_tasks([{'description': 'B', 'created': 't2', 'completed': True}])] == [3]",
+            "assert result.get_task(3) == {'id': 3, 'description': 'B', 'created': 't2', 'completed': True}",
+            "assert result.get_task(99) is None",
+            "assert result.count() == 3",
+            "assert result.count(completed=False) == 2"
+        ]
+    },
+    "task_store_list": {
+        "description": "Test TaskStore.list_tasks filters and keyset pagination",
+        "module": "modules.storage",
+        "function": "TaskStore",
+        "args": [":memory:"],
+        "assertions": [
+            "assert len(result.insert_tasks([{'description': 'Alpha', 'created': 't1', 'completed': False}, {'description': 'beta', 'created': 't1', 'completed': True}, {'description': 'Alpine', 'created': 't2', 'completed': False}])) == 3",
+            "assert result.list_tasks(limit=2) == (result.list_tasks()[0][:2], ('t1', 2))",
+            "assert [t['id'] for t in result.list_tasks(after=('t1', 2))[0]] == [3]",
+            "assert result.list_tasks(after=('t1', 2))[1] is None",
+            "assert [t['id'] for t in result.list_tasks(prefix='al')[0]] == [1, 3]",
+            "assert [t['id'] for t in result.list_tasks(completed=True)[0]] == [2]",
+            "assert [t['id'] for t in result.list_tasks(created_after='t1')[0]] == [3]"
+        ]
+    },
+    "task_store_list_ties": {
+        "description": "Test keyset pages inside a large same-timestamp batch",
+        "module": "modules.storage",
+        "function": "TaskStore",
+        "args": [":memory:"],
+        "assertions": [
+            "assert len(result.insert_tasks([{'description': 'Tied', 'created': 't1', 'completed': False}] * 20000)) == 20000",
+            "assert len(result.insert_tasks([{'description': 'Later', 'created': 't2', 'completed': True}] * 3)) == 3",
+            "assert [t['id'] for t in result.list_tasks(after=('t1', 19000), limit=3)[0]] == [19001, 19002, 19003]",
+            "assert result.list_tasks(after=('t1', 19998), limit=3) == (result.list_tasks(after=('t1', 19998))[0][:3], ('t2', 20001))",
+            "assert [t['id'] for t in result.list_tasks(after=('t1', 19999), completed=True)[0]] == [20001, 20002, 20003]",
+            "assert result.list_tasks(after=('t2', 20003)) == ([], None)",
+            "assert sum(map(len, result.iter_tasks(700))) == 20003"
+        ]
+    },
+    "task_store_update_digest_filter": {
+        "description": "Test a description changed by update_tasks is deduplicated behind the Bloom filter",
+        "module": "modules.storage",
+        "function": "TaskStore",
+        "args": [":memory:"],
+        "assertions": [
+            "assert result.enable_digest_filter(100) is None",
+            "assert [t['id'] for t in result.insert_tasks([{'description': 'Buy eggs', 'created': 't1', 'completed': False}])] == [1]",
+            "assert result.update_tasks([{'id': 1, 'description': 'Buy milk'}])[0]['status'] == 'updated'",
+            "assert result.insert_tasks([{'description': 'buy  milk', 'created': 't2', 'completed': False}], 'skip') == []",
+            "assert result.count() == 1"
+        ]
+    },
+    "task_store_insert_batches": {
+        "description": "Test insert_task_batches commits batches together and isolates a failing one",
+        "module": "modules.storage",
+        "function": "TaskStore",
+        "args": [":memory:", "FULL"],
+        "assertions": [
+            "assert [[t['id'] for t in r] if isinstance(r, list) else type(r).__name__ for r in result.insert_task_batches([([{'description': 'A', 'created': 't1', 'completed': False}], None), ([{'description': 'B', 'completed': False}], None), ([{'description': 'C', 'created': 't2', 'completed': False}], None)])] == [[1], 'KeyError', [2]]",
+            "assert result.count() == 2"
+        ]
+    },
+    "group_commit_insert": {
+        "description": "Test GroupCommitter serves concurrent callers, isolates a failing batch and closes",
+        "module": "modules.storage",
+        "function": "GroupCommitter",
+        "args": lambda: [scratch_store("FULL")],
+        "assertions": [
+            "assert sorted(sum(insert_concurrently(result, [[{'description': f'Task {n}.{i}', 'created': 't1', 'completed': False} for i in range(5)] for n in range(32)], 8), [])) == list(range(1, 161))",
+            "assert result.groups <= 32 and result.store.count() == 160",
+            "assert insert_concurrently(result, [[{'description': 'A', 'created': 't2', 'completed': False}], [{'description': 'B'}], [{'description': 'C', 'created': 't2', 'completed': False}]], 3) in ([[161], 'KeyError', [162]], [[162], 'KeyError', [161]])",
+            "assert result.store.count() == 162",
+            "assert result.close() is None and not result._thread.is_alive()",
+            "assert raises(result.insert_tasks, [{'description': 'Late', 'created': 't3', 'completed': False}]) == 'RuntimeError'",
+            "assert shutil.rmtree(os.path.dirname(result.store.path)) is None"
+        ]
+    },
+    "config_validation": {
+        "description": "Test validate_config merges config.json over the defaults",
+        "module": "modules.config",
+        "function": "validate_config",
+        "args": [{"port": 8080, "custom_key": "kept"}],
+        "assertions": [
+            "assert result['port'] == 8080 and result['page_size'] == 50",
+            "assert result['custom_key'] == 'kept'",
+            "assert __import__('modules.config', fromlist=['Config']).Config('missing-config.json', watch=False)['port'] == 5000",
+            "assert result['db_synchronous'] == 'NORMAL'",
+            "assert __import__('modules.config', fromlist=['validate_config']).validate_config({'group_commit': True})['db_synchronous'] == 'FULL'",
+            "assert raises(__import__('modules.config', fromlist=['validate_config']).validate_config, {'group_commit': True, 'db_synchronous': 'NORMAL'}) == 'ConfigError'",
+            "assert raises(__import__('modules.config', fromlist=['validate_config']).validate_config, {'dedup_bloom_capacity': 1000, 'workers': 2}) == 'ConfigError'",
+            "assert __import__('modules.config', fromlist=['validate_config']).validate_config({'dedup_bloom_capacity': 1000, 'workers': 1})['dedup_bloom_capacity'] == 1000"
+        ]
+    },
+    "sanitize_filenames_dedup": {
+        "description": "Test sanitize_filenames replaces unsafe characters and de-duplicates names",
+        "module": "modules.utils",
+        "function": "sanitize_filenames",
+        "args": [["a/b.txt", " a:b.txt ", "A_B.TXT", ".env", ".env"]],
+        "assertions": [
+            "assert result == ['a_b.txt', 'a_b (1).txt', 'A_B (2).TXT', '.env', '.env (1)']"
+        ]
+    },
+    "export_tasks_csv_gzip": {
+        "description": "Test export_tasks streams gzipped CSV chunk by chunk",
+        "module": "modules.core",
+        "function": "export_tasks",
+        "args": [[[{"id": 1, "description": "a, \"b\"", "created": "t", "completed": True}], [{"id": 2, "description": "c", "created": "t", "completed": False}]], "csv", True],
+        "assertions": [
+            "assert __import__('gzip').decompress(b''.join(result)) == b'id,description,created,completed\\n1,\"a, \"\"b\"\"\",t,true\\n2,c,t,false\\n'"
+        ]
+    },
+    "compress_gzip_roundtrip": {
+        "description": "Test compress produces a gzip body that decodes to the input",
+        "module": "modules.compression",
+        "function": "compress",
+        "args": [b'{"tasks": []}' * 200, "gzip", 1],
+        "assertions": [
+            "assert __import__('gzip').decompress(result) == b'{\"tasks\": []}' * 200",
+            "assert len(result) < 200"
+        ]
+    },
+    "encode_response_envelope": {
+        "description": "Test encode_response matches the format_response envelope",
+        "module": "modules.serializer",
+        "function": "encode_response",
+        "args": [[{"id": 1, "description": "Tâche"}], "error"],
+        "assertions": [
+            "assert json.loads(result)['status'] == 'error'",
+            "assert json.loads(result)['data'] == [{'id': 1, 'description': 'Tâche'}]",
+            "assert isinstance(json.loads(result)['timestamp'], str)"
+        ]
+    },
+    "task_store_batch_mutations": {
+        "description": "Test TaskStore batch update/delete return per-id results",
+        "module": "modules.storage",
+        "function": "TaskStore",
+        "args": [":memory:"],
+        "assertions": [
+            "assert len(result.insert_tasks([{'description': 'A', 'created': 't1', 'completed': False}] * 3)) == 3",
+            "assert [r['status'] for r in result.update_tasks([{'id': 1, 'completed': True}, {'id': 9, 'completed': True}])] == ['updated', 'not_found']",
+            "assert result.get_task(1)['completed'] is True",
+            "assert result.update_tasks([{'id': 2, 'description': 'B'}])[0]['task']['description'] == 'B'",
+            "assert [r['status'] for r in result.delete_tasks([3, 3])] == ['deleted', 'not_found']",
+            "assert result.count() == 2"
+        ]
+    },
+    "task_store_search": {
+        "description": "Test TaskStore.search_tasks keeps its full-text index in sync",
+        "module": "modules.storage",
+        "function": "TaskStore",
+        "args": [":memory:"],
+        "assertions": [
+            "assert len(result.insert_tasks([{'description': d, 'created': 't', 'completed': False} for d in ['Buy milk', 'Buying bread', 'Walk dog']])) == 3",
+            "assert sorted(t['id'] for t in result.search_tasks('BUY')) == [1, 2]",
+            "assert [t['id'] for t in result.search_tasks('buy mil')] == [1]",
+            "assert result.update_tasks([{'id': 3, 'description': 'Buy dog food'}])[0]['status'] == 'updated'",
+            "assert result.delete_tasks([1])[0]['status'] == 'deleted'",
+            "assert sorted(t['id'] for t in result.search_tasks('buy')) == [2, 3]"
+        ]
+    },
+    "task_store_dedup": {
+        "description": "Test TaskStore.insert_tasks skips or merges duplicate descriptions",
+        "module": "modules.storage",
+        "function": "TaskStore",
+        "args": [":memory:"],
+        "assertions": [
+            "assert [t['id'] for t in result.insert_tasks([{'description': d, 'created': 't', 'completed': False} for d in ['Buy milk', 'buy  MILK', 'Walk dog']], dedup='skip')] == [1, 2]",
+            "assert [t['id'] for t in result.insert_tasks([{'description': d, 'created': 't', 'completed': False} for d in ['BUY MILK', 'Read', 'read']], dedup='merge')] == [1, 3, 3]",
+            "assert [t['id'] for t in result.insert_tasks([{'description': 'Walk dog', 'created': 't', 'completed': False}])] == [4]"
+        ]
+    },
+    "bloom_filter_membership": {
+        "description": "Test BloomFilter has no false negatives",
+        "module": "modules.dedup",
+        "function": "BloomFilter",
+        "args": [1000, 0.01],
+        "assertions": [
+            "assert not any(map(result.add, range(-500, 500)))",
+            "assert all(map(result.__contains__, range(-500, 500)))",
+            "assert sum(map(result.__contains__, range(10**6, 10**6 + 1000))) < 100"
+        ]
+    },
+    "parse_batch_update_valid": {
+        "description": "Test parse_batch_update normalises changes",
+        "module": "modules.core",
+        "function": "parse_batch_update",
+        "args": [{"tasks": [{"id": 1, "completed": True}, {"id": 2, "description": "  New  "}]}],
+        "assertions": [
+            "assert result == [{'id': 1, 'completed': True}, {'id': 2, 'description': 'New'}]"
+        ]
+    },
+    "ingest_task_stream_chunks": {
+        "description": "Test ingest_task_stream persists NDJSON lines in fixed-size chunks",
+        "module": "modules.core",
+        "function": "ingest_task_stream",
+        "args": [['"A"', '{"description": "B"}', 'not json', '""'], lambda tasks: tasks, 2],
+        "assertions": [
+            "assert [(a['chunk'], a['accepted'], a['rejected']) for a in result] == [(1, 2, 0), (2, 0, 2)]"
+        ]
+    }
+}
+
+
+TestOutcome = Tuple[Dict[str, Any], str]
+
+PHASE_HEADERS = {
+    "phase_1_backend": "🔬 PHASE 1: BACKEND FUNCTION TESTING",
+    "phase_2_api": "\n🌐 PHASE 2: API INTEGRATION TESTING",
+    "phase_2_5_contracts": "\n🔗 PHASE 2.5: DATA CONTRACT VALIDATION",
+    "phase_3_frontend": "\n🖥️ PHASE 3: FRONTEND INTEGRATION TESTING",
+}
+
+
+def raises(func: Callable[..., Any], *args: Any) -> str:
+    """Name of the exception func(*args) raises ("" if none), for assertion expressions"""
+    try:
+        func(*args)
+    except Exception as e:
+        return type(e).__name__
+    return ""
+
+
+def scratch_store(synchronous: str = "NORMAL") -> TaskStore:
+    """TaskStore in a new temporary directory; remove it with shutil.rmtree(os.path.dirname(store.path))"""
+    return TaskStore(os.path.join(tempfile.mkdtemp(prefix="todo-test-"), "tasks.db"), synchronous)
+
+
+def insert_concurrently(writer: Any, batches: List[List[Dict[str, Any]]], workers: int) -> List[Any]:
+    """Insert batches from a thread pool; per batch the stored ids, or the name of the exception raised"""
+    with ThreadPoolExecutor(workers) as pool:
+        futures = [pool.submit(writer.insert_tasks, batch) for batch in batches]
+    outcomes = []
+    for future in futures:
+        error = future.exception()
+        outcomes.append(type(error).__name__ if error else [task["id"] for task in future.result()])
+    return outcomes
+
+
+def ndjson_app(environ: Dict[str, Any], start_response: Callable[..., Any]) -> Any:
+    """WSGI app streaming two NDJSON lines without a Content-Length"""
+    start_response("200 OK", [("Content-Type", "application/x-ndjson")])
+    return iter([b"a\n", b"b\n"])
+
+
+def stream_response(middleware: Any) -> Tuple[bytes, int, int]:
+    """Read a response through a MetricsMiddleware; returns the body and the in-flight gauge before and after close()"""
+    body = middleware({"REQUEST_METHOD": "GET"}, lambda status, headers, exc_info=None: None)
+    content = b"".join(body)
+    in_flight = middleware.metrics._collect().in_flight
+    body.close()
+    return content, in_flight, middleware.metrics._collect().in_flight
+
+
+def observe_from_threads(registry: Any, count: int) -> int:
+    """Record one request from each of count short-lived threads; returns the threads still tracked"""
+    for _ in range(count):
+        thread = threading.Thread(target=registry.observe_request, args=("/api/tasks", "GET", 200, 0.001))
+        thread.start()
+        thread.join()
+    return len(registry._threads)
+
+
+def run_backend_test(test_name: str) -> TestOutcome:
+    """
+    Run one Phase 1 test by name
+
+    Module-level so a process pool can run it; the config is looked up
+    in the worker because some test args (lambdas) cannot be pickled.
+    args may be a callable building the list, for args with side effects
+    (e.g. a database file) that should only happen when the test runs.
+
+    Returns:
+        Tuple of (result entry, log message)
+    """
+    test_config = BACKEND_TESTS[test_name]
+    try:
+        module = __import__(test_config['module'], fromlist=[test_config['function']])
+        func = getattr(module, test_config['function'])
+        args = test_config.get('args', [])
+        if callable(args):
+            args = args()
+        result = func(*args)
+        for assertion in test_config['assertions']:
+            exec(assertion)
+        return {
+            "success": True,
+            "result": "Test completed successfully",
+            "error": None
+        }, f"✅ {test_name}: PASSED"
+    except Exception as e:
+        return {
+            "success": False,
+            "result": None,
+            "error": str(e)
+        }, f"❌ {test_name}: FAILED - {e}"
+
+
 class TestSuite:
     """
     Comprehensive testing suite template following 4-phase methodology:
@@ -23,8 +482,9 @@ class TestSuite:
     Phase 3: Frontend Integration Testing (MANDATORY)
     """
     
-    def __init__(self, base_url: str = "http://localhost:5000"):
+    def __init__(self, base_url: str = BASE_URL):
         self.base_url = base_url
+        self.http = get_session()
         self.results = {
             "phase_1_backend": {},
             "phase_2_api": {},
@@ -39,145 +499,230 @@ class TestSuite:
         icon = {"TEST": "🧪", "INFO": "ℹ️", "PASS": "✅", "FAIL": "❌", "WARN": "⚠️"}
         print(f"{icon.get(level, 'ℹ️')} [{timestamp}] {message}")
     
+    def _record(self, phase: str, test_name: str, outcome: TestOutcome):
+        """Store a test's result entry and log its outcome"""
+        result, message = outcome
+        self.results[phase][test_name] = result
+        self.log(message, "PASS" if result["success"] else "FAIL")
+    
+    def _run_phase(self, phase: str, cases: List[Tuple[str, str, Callable[[], TestOutcome]]]):
+        """Run a phase's (test_name, label, runner) cases one after another"""
+        for test_name, label, runner in cases:
+            self.log(label)
+            self._record(phase, test_name, runner())
+    
+    def _backend_cases(self) -> List[Tuple[str, str, Callable[[], TestOutcome]]]:
+        return [
+            (name, f"Testing {config['description']}...", lambda name=name: run_backend_test(name))
+            for name, config in BACKEND_TESTS.items()
+        ]
+    
     def phase_1_backend_tests(self):
         """Phase 1: Test all backend functions directly"""
-        self.log("🔬 PHASE 1: BACKEND FUNCTION TESTING", "TEST")
+        self.log(PHASE_HEADERS["phase_1_backend"], "TEST")
         self.log("=" * 60)
-        
-        # DRY configuration - customize for your project
-        backend_tests = {
-            "core_function": {
-                "description": "Test core functionality",
-                "module": "modules.core",
-                "function": "get_status",
+        self._run_phase("phase_1_backend", self._backend_cases())
+    
+    def _api_cases(self) -> List[Tuple[str, str, Callable[[], TestOutcome]]]:
+        # Limits of the server under test (started from the project root)
+        settings = read_config_file(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "config.json"))
+        api_tests = {
+            "health_endpoint": {
+                "endpoint": "/health",
+                "expected_fields": ["status"]
+            },
+            "input_tasks_endpoint": {
+                "endpoint": "/api/tasks",
+                "method": "POST",
+                "payload": {"tasks": ["Task A", "Task B"]},
+                "expected_fields": ["status", "timestamp", "data"],
+                "expected_data_length": 2
+            },
+            "search_tasks_endpoint": {
+                "endpoint": "/api/tasks/search?q=task",
+                "expected_fields": ["status", "timestamp", "data"]
+            },
+            "list_tasks_endpoint": {
+                "endpoint": "/api/tasks?limit=1",
+                "expected_fields": ["status", "timestamp", "data"]
+            },
+            "ingest_stream_endpoint": {
+                "endpoint": "/api/tasks/stream",
+                "method": "POST",
+                "data": b'"Streamed A"\n{"description": "Streamed B"}\nnot json\n\n',
+                "headers": {"Content-Type": "application/x-ndjson"},
                 "assertions": [
-                    "assert 'status' in result",
-                    "assert result['status'] == 'running'"
+                    "assert response.headers['Content-Type'].startswith('application/x-ndjson')",
+                    "assert (lambda ack, summary: (ack['chunk'], ack['accepted'], ack['rejected'], ack['last_id'] - ack['first_id'], summary['status'], summary['data']))(*map(json.loads, response.text.splitlines())) == (1, 2, 1, 1, 'success', {'chunks': 1, 'accepted': 2, 'rejected': 1})",
+                    # The scrape counts itself; finished streams must not push the gauge below that
+                    "assert float(next(filter(lambda line: line.startswith('todo_app_requests_in_flight '), self.http.get(f'{self.base_url}/metrics', timeout=10).text.splitlines())).split()[1]) >= 1"
                 ]
             },
-            "input_tasks_basic": {
-                "description": "Test input_tasks with a simple list of tasks",
-                "module": "modules.core",
-                "function": "input_tasks",
-                "args": [["Buy milk", "Read book", "Write code"]],
+            "export_ndjson_endpoint": {
+                "endpoint": "/api/tasks/export",
+                "headers": {"Accept-Encoding": "identity"},
                 "assertions": [
-                    "assert isinstance(result, list)",
-                    "assert len(result) == 3",
-                    "assert result[0]['description'] == 'Buy milk'",
-                    "assert result[1]['id'] == 2",
-                    "assert result[2]['completed'] is False"
+                    "assert response.headers['Content-Type'].startswith('application/x-ndjson') and 'Content-Encoding' not in response.headers",
+                    "assert response.headers['Content-Disposition'] == 'attachment; filename=\"tasks.ndjson\"'",
+                    "assert all(map(lambda task: set(task) == {'id', 'description', 'created', 'completed'}, map(json.loads, response.text.splitlines())))",
+                    "assert self._create_task('Exported task')['description'] in self.http.get(url, headers=test_config['headers'], timeout=10).text"
                 ]
             },
-            "input_tasks_empty": {
-                "description": "Test input_tasks with an empty list",
-                "module": "modules.core",
-                "function": "input_tasks",
-                "args": [[]],
+            "export_csv_gzip_endpoint": {
+                "endpoint": "/api/tasks/export?format=csv",
+                "headers": {"Accept-Encoding": "gzip"},
                 "assertions": [
-                    "assert isinstance(result, list)",
-                    "assert len(result) == 0"
+                    "assert response.headers['Content-Encoding'] == 'gzip' and 'Content-Length' not in response.headers",
+                    "assert response.headers['Content-Type'].startswith('text/csv')",
+                    "assert response.text.splitlines()[0] == 'id,description,created,completed'",
+                    "assert float(next(filter(lambda line: line.startswith('todo_app_requests_in_flight '), self.http.get(f'{self.base_url}/metrics', timeout=10).text.splitlines())).split()[1]) >= 1"
                 ]
             },
-            "input_tasks_invalid": {
-                "description": "Test input_tasks with invalid/blank tasks",
-                "module": "modules.core",
-                "function": "input_tasks",
-                "args": [["", None, "  ", "Task"]],
+            "export_invalid_format": {
+                "endpoint": "/api/tasks/export?format=xml",
+                "expected_status": 400,
+                "expected_fields": ["status", "data"],
+                "assertions": ["assert data['status'] == 'error'"]
+            },
+            "idempotent_create": {
+                "endpoint": "/api/tasks",
+                "method": "POST",
+                "payload": {"tasks": ["Idempotent task"]},
+                "headers": {"Idempotency-Key": f"test-{uuid.uuid4()}"},
+                "expected_fields": ["status", "timestamp", "data"],
                 "assertions": [
-                    "assert isinstance(result, list)",
-                    "assert len(result) == 1",
-                    "assert result[0]['description'] == 'Task'"
+                    "assert 'Idempotent-Replayed' not in response.headers",
+                    "assert (lambda replay, first: (replay.status_code, replay.headers.get('Idempotent-Replayed'), replay.content == first))(self.http.post(url, json=payload, headers=test_config['headers'], timeout=10), response.content) == (200, 'true', True)",
+                    "assert self.http.post(url, json={'tasks': ['Other task']}, headers=test_config['headers'], timeout=10).status_code == 422"
                 ]
-            }
-        }
-        
-        for test_name, test_config in backend_tests.items():
-            self.log(f"Testing {test_config['description']}...")
-            try:
-                module = __import__(test_config['module'], fromlist=[test_config['function']])
-                func = getattr(module, test_config['function'])
-                args = test_config.get('args', [])
-                result = func(*args)
-                for assertion in test_config['assertions']:
-                    exec(assertion)
-                self.results["phase_1_backend"][test_name] = {
-                    "success": True,
-                    "result": "Test completed successfully",
-                    "error": None
-                }
-                self.log(f"✅ {test_name}: PASSED", "PASS")
-            except Exception as e:
-                self.results["phase_1_backend"][test_name] = {
-                    "success": False,
-                    "result": None,
-                    "error": str(e)
-                }
-                self.log(f"❌ {test_name}: FAILED - {e}", "FAIL")
-    
-    def phase_2_api_tests(self):
-        """Phase 2: Test all API endpoints"""
-        self.log("\n🌐 PHASE 2: API INTEGRATION TESTING", "TEST")
-        self.log("=" * 60)
-        
-        api_tests = {
-            "health_endpoint": {
-                "endpoint": "/health",
-                "expected_fields": ["status"]
             },
-            "input_tasks_endpoint": {
+            "idempotency_key_invalid": {
                 "endpoint": "/api/tasks",
                 "method": "POST",
-                "payload": {"tasks": ["Task A", "Task B"]},
+                "payload": {"tasks": ["Never stored"]},
+                "headers": {"Idempotency-Key": "k" * 256},
+                "expected_status": 400,
+                "expected_fields": ["status", "data"],
+                "assertions": [
+                    "assert data['data'] == 'Idempotency-Key must be 1-255 characters'",
+                    "assert self.http.post(url, json=payload, headers={'Idempotency-Key': ''}, timeout=10).status_code == 400"
+                ]
+            },
+            "batch_update_endpoint": {
+                "endpoint": "/api/tasks/batch",
+                "method": "PATCH",
+                "payload": lambda: {"tasks": [
+                    {"id": self._create_task("Batch update me")["id"], "completed": True, "description": "Batch updated"},
+                    {"id": 2 ** 31, "completed": True}
+                ]},
                 "expected_fields": ["status", "timestamp", "data"],
-                "expected_data_length": 2
+                "assertions": [
+                    "assert [r['status'] for r in data['data']] == ['updated', 'not_found']",
+                    "assert data['data'][0]['task']['completed'] is True",
+                    "assert data['data'][0]['task']['description'] == 'Batch updated'"
+                ]
+            },
+            "batch_update_invalid": {
+                "endpoint": "/api/tasks/batch",
+                "method": "PATCH",
+                "payload": {"tasks": [{"id": 1}]},
+                "expected_status": 400,
+                "expected_fields": ["status", "data"],
+                "assertions": [
+                    "assert data['status'] == 'error' and 'nothing to update' in data['data']",
+                    "assert self.http.patch(f'{self.base_url}/api/tasks/batch', data='not json', timeout=10).status_code == 400"
+                ]
+            },
+            "batch_delete_endpoint": {
+                "endpoint": "/api/tasks/batch",
+                "method": "DELETE",
+                "payload": lambda: {"ids": [self._create_task("Batch delete me")["id"], 2 ** 31]},
+                "expected_fields": ["status", "timestamp", "data"],
+                "assertions": [
+                    "assert [r['status'] for r in data['data']] == ['deleted', 'not_found']",
+                    "assert self.http.delete(url, json={'ids': [data['data'][0]['id']]}, timeout=10).json()['data'][0]['status'] == 'not_found'"
+                ]
+            },
+            "batch_delete_too_large": {
+                "endpoint": "/api/tasks/batch",
+                "method": "DELETE",
+                "payload": {"ids": list(range(1, settings["max_batch_size"] + 2))},
+                "expected_status": 400,
+                "expected_fields": ["status", "data"],
+                "assertions": [
+                    f"assert data['data'] == 'At most {settings['max_batch_size']} ids per batch'",
+                    "assert self.http.delete(url, json={'ids': ['1']}, timeout=10).status_code == 400"
+                ]
             }
         }
-        
-        for test_name, test_config in api_tests.items():
-            self.log(f"Testing {test_config['endpoint']}...")
-            try:
-                method = test_config.get("method", "GET")
-                url = f"{self.base_url}{test_config['endpoint']}"
-                if method == "POST":
-                    response = requests.post(url, json=test_config.get("payload", {}), timeout=10)
-                else:
-                    response = requests.get(url, timeout=10)
-                if response.status_code != 200:
-                    raise Exception(f"HTTP {response.status_code}")
-                data = response.json()
-                missing_fields = []
-                for field in test_config['expected_fields']:
-                    if field not in data:
-                        missing_fields.append(field)
-                if missing_fields:
-                    raise Exception(f"Missing fields: {missing_fields}")
-                # Additional checks for /api/tasks
-                if test_name == "input_tasks_endpoint":
-                    if not isinstance(data["data"], list) or len(data["data"]) != test_config["expected_data_length"]:
-                        raise Exception("Returned data list does not match expected length")
-                    if data["data"][0]["description"] != "Task A":
-                        raise Exception("First task description mismatch")
-                self.results["phase_2_api"][test_name] = {
-                    "success": True,
-                    "endpoint": test_config['endpoint'],
-                    "expected_fields": test_config['expected_fields'],
-                    "missing_fields": [],
-                    "details": f"✅ All {len(test_config['expected_fields'])} fields present"
-                }
-                self.log(f"✅ {test_config['endpoint']}: PASSED", "PASS")
-            except Exception as e:
-                self.results["phase_2_api"][test_name] = {
-                    "success": False,
-                    "endpoint": test_config['endpoint'],
-                    "error": str(e)
-                }
-                self.log(f"❌ {test_config['endpoint']}: FAILED - {e}", "FAIL")
+        return [
+            (name, f"Testing {config['endpoint']}...", lambda name=name, config=config: self._run_api_test(name, config))
+            for name, config in api_tests.items()
+        ]
     
-    def phase_2_5_contract_validation(self):
-        """Phase 2.5: Validate API-Frontend data contracts"""
-        self.log("\n🔗 PHASE 2.5: DATA CONTRACT VALIDATION", "TEST")
+    def _run_api_test(self, test_name: str, test_config: Dict[str, Any]) -> TestOutcome:
+        """
+        Send one request and check it. Besides endpoint and expected_fields,
+        a case may set method, payload (a dict, or a callable building it),
+        data (raw body), headers, expected_status, and assertions: expressions
+        run with `response`, `data` (the parsed JSON body) and `self` in scope
+        """
+        try:
+            method = test_config.get("method", "GET")
+            url = f"{self.base_url}{test_config['endpoint']}"
+            payload = test_config.get("payload")
+            if callable(payload):
+                payload = payload()
+            response = self.http.request(
+                method, url, json=payload, data=test_config.get("data"),
+                headers=test_config.get("headers"), timeout=10
+            )
+            expected_status = test_config.get("expected_status", 200)
+            if response.status_code != expected_status:
+                raise Exception(f"HTTP {response.status_code}")
+            data = response.json() if response.headers.get("Content-Type") == "application/json" else None
+            missing_fields = []
+            for field in test_config.get('expected_fields', []):
+                if data is None or field not in data:
+                    missing_fields.append(field)
+            if missing_fields:
+                raise Exception(f"Missing fields: {missing_fields}")
+            # Additional checks for /api/tasks
+            if test_name == "input_tasks_endpoint":
+                if not isinstance(data["data"], list) or len(data["data"]) != test_config["expected_data_length"]:
+                    raise Exception("Returned data list does not match expected length")
+                if data["data"][0]["description"] != "Task A":
+                    raise Exception("First task description mismatch")
+            for assertion in test_config.get("assertions", []):
+                exec(assertion)
+            return {
+                "success": True,
+                "endpoint": test_config['endpoint'],
+                "expected_fields": test_config.get('expected_fields', []),
+                "missing_fields": [],
+                "details": f"✅ HTTP {expected_status}, {len(test_config.get('expected_fields', []))} fields, "
+                           f"{len(test_config.get('assertions', []))} assertions"
+            }, f"✅ {test_name} ({method} {test_config['endpoint']}): PASSED"
+        except Exception as e:
+            return {
+                "success": False,
+                "endpoint": test_config['endpoint'],
+                "error": str(e) or type(e).__name__
+            }, f"❌ {test_name} ({test_config.get('method', 'GET')} {test_config['endpoint']}): FAILED - {str(e) or type(e).__name__}"
+
+    def _create_task(self, description: str) -> Dict[str, Any]:
+        """POST one task and return it as stored"""
+        response = self.http.post(f"{self.base_url}/api/tasks", json={"tasks": [description]}, timeout=10)
+        response.raise_for_status()
+        return response.json()["data"][0]
+
+    def phase_2_api_tests(self):
+        """Phase 2: Test all API endpoints"""
+        self.log(PHASE_HEADERS["phase_2_api"], "TEST")
         self.log("=" * 60)
-        
+        self._run_phase("phase_2_api", self._api_cases())
+    
+    def _contract_cases(self) -> List[Tuple[str, str, Callable[[], TestOutcome]]]:
         # Test data contracts between API and frontend
         contract_tests = {
             "main_contract": {
@@ -203,90 +748,123 @@ class TestSuite:
                 ]
             }
         }
-        
-        for test_name, test_config in contract_tests.items():
-            self.log(f"Validating {test_config['api_endpoint']} contract...")
-            
-            try:
-                method = test_config.get("method", "GET")
-                if method == "POST":
-                    response = requests.post(f"{self.base_url}{test_config['api_endpoint']}", json=test_config.get("payload", {}), timeout=10)
-                else:
-                    response = requests.get(f"{self.base_url}{test_config['api_endpoint']}", timeout=10)
-                data = response.json()
-                # Validate structure
-                missing_fields = []
-                for field_path, expected_type in test_config['expected_structure'].items():
-                    if '.' in field_path:
-                        parts = field_path.split('.')
-                        current = data
-                        for part in parts:
-                            if part not in current:
-                                missing_fields.append(field_path)
-                                break
-                            current = current[part]
-                    else:
-                        if field_path not in data:
-                            missing_fields.append(field_path)
-                        elif expected_type == "list" and not isinstance(data[field_path], list):
+        return [
+            (name, f"Validating {config['api_endpoint']} contract...",
+             lambda name=name, config=config: self._run_contract_test(name, config))
+            for name, config in contract_tests.items()
+        ]
+    
+    def _run_contract_test(self, test_name: str, test_config: Dict[str, Any]) -> TestOutcome:
+        try:
+            method = test_config.get("method", "GET")
+            if method == "POST":
+                response = self.http.post(f"{self.base_url}{test_config['api_endpoint']}", json=test_config.get("payload", {}), timeout=10)
+            else:
+                response = self.http.get(f"{self.base_url}{test_config['api_endpoint']}", timeout=10)
+            data = response.json()
+            # Validate structure
+            missing_fields = []
+            for field_path, expected_type in test_config['expected_structure'].items():
+                if '.' in field_path:
+                    parts = field_path.split('.')
+                    current = data
+                    for part in parts:
+                        if part not in current:
                             missing_fields.append(field_path)
-                self.results["phase_2_5_contracts"][test_name] = {
-                    "success": len(missing_fields) == 0,
-                    "api_endpoint": test_config['api_endpoint'],
-                    "missing_fields": missing_fields,
-                    "sample_data": {k: str(v)[:50] for k, v in data.items() if k != 'error'}
-                }
-                if missing_fields:
-                    self.log(f"❌ {test_name}: CONTRACT INVALID - Missing: {missing_fields}", "FAIL")
+                            break
+                        current = current[part]
                 else:
-                    self.log(f"✅ {test_name}: CONTRACT VALID", "PASS")
-            except Exception as e:
-                self.results["phase_2_5_contracts"][test_name] = {
-                    "success": False,
-                    "error": str(e)
-                }
-                self.log(f"❌ {test_name}: CONTRACT ERROR - {e}", "FAIL")
+                    if field_path not in data:
+                        missing_fields.append(field_path)
+                    elif expected_type == "list" and not isinstance(data[field_path], list):
+                        missing_fields.append(field_path)
+            result = {
+                "success": len(missing_fields) == 0,
+                "api_endpoint": test_config['api_endpoint'],
+                "missing_fields": missing_fields,
+                "sample_data": {k: str(v)[:50] for k, v in data.items() if k != 'error'}
+            }
+            if missing_fields:
+                return result, f"❌ {test_name}: CONTRACT INVALID - Missing: {missing_fields}"
+            return result, f"✅ {test_name}: CONTRACT VALID"
+        except Exception as e:
+            return {
+                "success": False,
+                "error": str(e)
+            }, f"❌ {test_name}: CONTRACT ERROR - {e}"
     
-    def phase_3_frontend_tests(self):
-        """Phase 3: Test frontend functionality"""
-        self.log("\n🖥️ PHASE 3: FRONTEND INTEGRATION TESTING", "TEST")
+    def phase_2_5_contract_validation(self):
+        """Phase 2.5: Validate API-Frontend data contracts"""
+        self.log(PHASE_HEADERS["phase_2_5_contracts"], "TEST")
         self.log("=" * 60)
-        
+        self._run_phase("phase_2_5_contracts", self._contract_cases())
+    
+    def _frontend_cases(self) -> List[Tuple[str, str, Callable[[], TestOutcome]]]:
         # Basic frontend tests - extend with browser automation if needed
         frontend_tests = [
             ("page_load", self._test_page_load),
+            ("etag_revalidation", self._test_etag_revalidation),
             # Add more frontend tests here
         ]
-        
-        for test_name, test_func in frontend_tests:
-            self.log(f"Testing {test_name}...")
+        return [
+            (name, f"Testing {name}...", lambda name=name, func=func: self._run_frontend_test(name, func))
+            for name, func in frontend_tests
+        ]
+    
+    def _run_frontend_test(self, test_name: str, test_func: Callable[[], Tuple[bool, str]]) -> TestOutcome:
+        try:
+            success, result = test_func()
+            entry = {
+                "success": success,
+                "result": result,
+                "error": None if success else result
+            }
+            if success:
+                return entry, f"✅ {test_name}: PASSED"
+            return entry, f"❌ {test_name}: FAILED - {result}"
+        except Exception as e:
+            return {
+                "success": False,
+                "result": None,
+                "error": str(e)
+            }, f"❌ {test_name}: ERROR - {e}"
+    
+    def phase_3_frontend_tests(self):
+        """Phase 3: Test frontend functionality"""
+        self.log(PHASE_HEADERS["phase_3_frontend"], "TEST")
+        self.log("=" * 60)
+        self._run_phase("phase_3_frontend", self._frontend_cases())
+    
+    def run_phases_parallel(self, workers: int = 4):
+        """
+        Run all phases concurrently: backend tests in a process pool and
+        HTTP checks in a thread pool. Results are logged afterwards in phase
+        order, so the output and `results` match a sequential run.
+        """
+        with ProcessPoolExecutor(max_workers=workers) as processes, \
+                ThreadPoolExecutor(max_workers=workers * 4) as threads:
+            pending: Dict[str, List[Tuple[str, str, Future]]] = {
+                "phase_1_backend": [
+                    (name, label, processes.submit(run_backend_test, name))
+                    for name, label, _ in self._backend_cases()
+                ]
+            }
+            for phase, cases in [("phase_2_api", self._api_cases()),
+                                 ("phase_2_5_contracts", self._contract_cases()),
+                                 ("phase_3_frontend", self._frontend_cases())]:
+                pending[phase] = [(name, label, threads.submit(runner)) for name, label, runner in cases]
             
-            try:
-                success, result = test_func()
-                
-                self.results["phase_3_frontend"][test_name] = {
-                    "success": success,
-                    "result": result,
-                    "error": None if success else result
-                }
-                
-                if success:
-                    self.log(f"✅ {test_name}: PASSED", "PASS")
-                else:
-                    self.log(f"❌ {test_name}: FAILED - {result}", "FAIL")
-                    
-            except Exception as e:
-                self.results["phase_3_frontend"][test_name] = {
-                    "success": False,
-                    "result": None,
-                    "error": str(e)
-                }
-                self.log(f"❌ {test_name}: ERROR - {e}", "FAIL")
+            for phase, futures in pending.items():
+                self.log(PHASE_HEADERS[phase], "TEST")
+                self.log("=" * 60)
+                for test_name, label, future in futures:
+                    self.log(label)
+                    self._record(phase, test_name, future.result())
     
     def _test_page_load(self) -> Tuple[bool, str]:
         """Test main page loading"""
         try:
-            response = requests.get(self.base_url, timeout=10)
+            response = self.http.get(self.base_url, timeout=10)
             if response.status_code == 200:
                 return True, "Main page loaded successfully"
             else:
@@ -294,6 +872,21 @@ class TestSuite:
         except Exception as e:
             return False, str(e)
     
+    def _test_etag_revalidation(self) -> Tuple[bool, str]:
+        """Test cached pages answer If-None-Match with 304"""
+        try:
+            for path in ["/", "/api", "/health"]:
+                response = self.http.get(f"{self.base_url}{path}", timeout=10)
+                etag = response.headers.get("ETag")
+                if not etag:
+                    return False, f"{path}: missing ETag"
+                revalidated = self.http.get(f"{self.base_url}{path}", headers={"If-None-Match": etag}, timeout=10)
+                if revalidated.status_code not in (200, 304) or (path != "/health" and revalidated.status_code != 304):
+                    return False, f"{path}: HTTP {revalidated.status_code} on revalidation"
+            return True, "Cached pages revalidate with 304"
+        except Exception as e:
+            return False, str(e)
+    
     def generate_summary(self):
         """Generate test summary"""
         total_tests = 0
@@ -323,8 +916,14 @@ class TestSuite:
         
         return total_tests, passed_tests, failed_tests
     
-    def run_all_tests(self):
-        """Run complete test suite"""
+    def run_all_tests(self, parallel: bool = False, workers: int = 4):
+        """
+        Run complete test suite
+        
+        Args:
+            parallel: Run tests concurrently (see run_phases_parallel)
+            workers: Process pool size when parallel
+        """
         self.log("🚀 todo app - COMPREHENSIVE TEST SUITE", "TEST")
         self.log("=" * 80)
         self.log(f"Target: {self.base_url}")
@@ -332,10 +931,13 @@ class TestSuite:
         self.log("")
         
         # Run all phases
-        self.phase_1_backend_tests()
-        self.phase_2_api_tests()
-        self.phase_2_5_contract_validation()
-        self.phase_3_frontend_tests()
+        if parallel:
+            self.run_phases_parallel(workers)
+        else:
+            self.phase_1_backend_tests()
+            self.phase_2_api_tests()
+            self.phase_2_5_contract_validation()
+            self.phase_3_frontend_tests()
         
         # Generate summary
         total, passed, failed = self.generate_summary()
@@ -367,8 +969,12 @@ class TestSuite:
 
 def main():
     """Main test runner"""
+    parser = argparse.ArgumentParser(description="todo app comprehensive test suite")
+    parser.add_argument("--parallel", action="store_true", help="Run tests concurrently")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 4, help="Process pool size for --parallel")
+    args = parser.parse_args()
     suite = TestSuite()
-    success = suite.run_all_tests()
+    success = suite.run_all_tests(parallel=args.parallel, workers=args.workers)
     sys.exit(0 if success else 1)
 
 if __name__ == "__main__":
@@ -7,41 +7,218 @@ Entry point for the todo app application.
 """
 
 
-from flask import Flask, jsonify
+import atexit
 import os
-import sys
-from pathlib import Path
 
+from flask import Blueprint, Flask, Response, current_app, jsonify, request, stream_with_context
+from werkzeug.local import LocalProxy
 
-# Add modules directory to path
-sys.path.insert(0, str(Path(__file__).parent / "modules"))
+from modules.core import (
+    get_status, input_tasks, ingest_task_stream,
+    parse_task_payload, parse_list_query, task_page,
+    parse_batch_update, parse_batch_delete, parse_search_query, parse_dedup_mode,
+    parse_export_query, export_tasks, EXPORT_FORMATS
+)
+from modules.utils import get_timestamp
+from modules.config import get_config
+from modules.log_writer import get_log_writer
+from modules.storage import GroupCommitter, TaskStore
+from modules.serializer import FastJSONProvider, dumps, encode_response
+from modules.cache import CachedViews, ResponseCache
+from modules.compression import ResponseCompressor
+from modules.metrics import MetricsMiddleware, metrics
+from modules.idempotency import IdempotencyCache, request_fingerprint
 
-app = Flask(__name__)
+bp = Blueprint("todo", __name__)
 
-# Import your modules here
-from modules.core import get_status, input_tasks
-from modules.utils import get_timestamp, format_response
-from flask import request
+# Services of the app handling the current request (set up by create_app)
+config = LocalProxy(lambda: current_app.extensions["todo"]["config"])
+store = LocalProxy(lambda: current_app.extensions["todo"]["store"])
+task_writer = LocalProxy(lambda: current_app.extensions["todo"]["task_writer"])
+idempotency_cache = LocalProxy(lambda: current_app.extensions["todo"]["idempotency_cache"])
+response_cache = LocalProxy(lambda: current_app.extensions["todo"]["response_cache"])
+cached_views = CachedViews(response_cache)
 
-@app.route('/api/tasks', methods=['POST'])
+def api_response(data, status: str = "success", code: int = 200) -> Response:
+    """Build a format_response envelope response using the pre-encoded fast path"""
+    return Response(encode_response(data, status), status=code, mimetype="application/json")
+
+@bp.route('/api/tasks', methods=['POST'])
 def api_input_tasks():
     """
-    Accepts a JSON list of task descriptions and returns structured tasks.
+    Accepts a JSON list of task descriptions, persists them and returns
+    the stored tasks with their allocated ids.
     Request body: {"tasks": ["task1", "task2", ...]}
+    Query params: dedup (skip/merge/off) to skip duplicate descriptions or
+    return the already stored task in their place
     Response: {"status": ..., "timestamp": ..., "data": [task_dicts]}
+    An Idempotency-Key header makes retries replay the first response.
     """
+    key = request.headers.get("Idempotency-Key")
+    if key is None:
+        return create_tasks()
+    if not 0 < len(key) <= 255:
+        return api_response("Idempotency-Key must be 1-255 characters", "error", 400)
+
+    def compute():
+        response = create_tasks()
+        return response.status_code, response.get_data()
+
+    fingerprint = request_fingerprint(request.method, request.full_path, request.get_data())
+    try:
+        status, body, replayed = idempotency_cache.execute(key, fingerprint, compute)
+    except ValueError as e:
+        return api_response(str(e), "error", 422)
+    response = Response(body, status=status, mimetype="application/json")
+    if replayed:
+        response.headers["Idempotent-Replayed"] = "true"
+    return response
+
+def create_tasks() -> Response:
+    """Validate, build and persist the tasks in the current request"""
     if not request.is_json:
-        return jsonify(format_response("Invalid or missing JSON", status="error")), 400
-    data = request.get_json()
-    tasks = data.get("tasks")
-    if not isinstance(tasks, list):
-        return jsonify(format_response("'tasks' must be a list", status="error")), 400
-    result = input_tasks(tasks)
-    return jsonify(format_response(result))
+        return api_response("Invalid or missing JSON", "error", 400)
+    try:
+        with metrics.stage("validate"):
+            dedup = parse_dedup_mode(request.args.get("dedup", config.get("dedup_mode")))
+            tasks = parse_task_payload(request.get_json())
+    except ValueError as e:
+        return api_response(str(e), "error", 400)
+    with metrics.stage("build"):
+        built = input_tasks(tasks)
+    with metrics.stage("persist"):
+        result = task_writer.insert_tasks(built, dedup)
+    with metrics.stage("serialize"):
+        return api_response(result)
+
+@bp.route('/api/tasks', methods=['GET'])
+def api_list_tasks():
+    """
+    Lists stored tasks ordered by (created, id) with keyset pagination.
+    Query params: completed (true/false), created_after, created_before,
+    prefix, limit, cursor (the next_cursor of the previous page)
+    Response: {"status": ..., "timestamp": ..., "data": {"tasks": [...], "next_cursor": ...}}
+    """
+    try:
+        query = parse_list_query(
+            request.args,
+            int(config.get("page_size", 50)),
+            int(config.get("max_page_size", 500))
+        )
+    except ValueError as e:
+        return api_response(str(e), "error", 400)
+    return api_response(task_page(*store.list_tasks(**query)))
+
+@bp.route('/api/tasks/search', methods=['GET'])
+def api_search_tasks():
+    """
+    Full-text search over task descriptions (case-insensitive word prefixes).
+    Query params: q (required), completed (true/false), limit
+    Response: {"status": ..., "timestamp": ..., "data": [task_dicts, best match first]}
+    """
+    try:
+        query = parse_search_query(
+            request.args,
+            int(config.get("page_size", 50)),
+            int(config.get("max_page_size", 500))
+        )
+        return api_response(store.search_tasks(**query))
+    except ValueError as e:
+        return api_response(str(e), "error", 400)
 
+@bp.route('/api/tasks/export', methods=['GET'])
+def api_export_tasks():
+    """
+    Streams every matching task in (created, id) order, reading the store
+    in keyset chunks so memory stays constant however many tasks there are.
+    Query params: format (ndjson/csv), completed, created_after,
+    created_before, prefix
+    Response: NDJSON (one task per line) or CSV with a header row, gzipped
+    on the fly when the client sends Accept-Encoding: gzip
+    """
+    try:
+        query = parse_export_query(request.args)
+    except ValueError as e:
+        return api_response(str(e), "error", 400)
+    fmt = query.pop("format")
+    compress = request.accept_encodings["gzip"] > 0
+    chunks = store.iter_tasks(int(config.get("export_chunk_size", 1000)), **query)
+    response = Response(stream_with_context(export_tasks(chunks, fmt, compress)), mimetype=EXPORT_FORMATS[fmt])
+    response.headers["Content-Disposition"] = f'attachment; filename="tasks.{fmt}"'
+    response.headers["Vary"] = "Accept-Encoding"
+    if compress:
+        response.headers["Content-Encoding"] = "gzip"
+    return response
+
+@bp.route('/api/tasks/batch', methods=['PATCH'])
+def api_update_tasks():
+    """
+    Updates many tasks in a single transaction.
+    Request body: {"tasks": [{"id": 1, "completed": true, "description": "..."}, ...]}
+    Response: {"status": ..., "timestamp": ..., "data": [per-id results]}
+    """
+    if not request.is_json:
+        return api_response("Invalid or missing JSON", "error", 400)
+    try:
+        changes = parse_batch_update(request.get_json(), int(config.get("max_batch_size", 1000)))
+    except ValueError as e:
+        return api_response(str(e), "error", 400)
+    return api_response(store.update_tasks(changes))
 
+@bp.route('/api/tasks/batch', methods=['DELETE'])
+def api_delete_tasks():
+    """
+    Deletes many tasks in a single transaction.
+    Request body: {"ids": [1, 2, ...]}
+    Response: {"status": ..., "timestamp": ..., "data": [per-id results]}
+    """
+    if not request.is_json:
+        return api_response("Invalid or missing JSON", "error", 400)
+    try:
+        task_ids = parse_batch_delete(request.get_json(), int(config.get("max_batch_size", 1000)))
+    except ValueError as e:
+        return api_response(str(e), "error", 400)
+    return api_response(store.delete_tasks(task_ids))
 
-@app.route('/health')
+@bp.route('/api/tasks/stream', methods=['POST'])
+def api_ingest_tasks():
+    """
+    Bulk ingest of newline-delimited JSON task descriptions.
+    Request body (application/x-ndjson): one "description" string or
+    {"description": ...} object per line.
+    Response (application/x-ndjson): one acknowledgement per persisted chunk,
+    followed by a format_response summary line.
+    Query params: dedup (skip/merge/off), as for POST /api/tasks
+    """
+    chunk_size = int(config.get("ingest_chunk_size", 500))
+    try:
+        dedup = parse_dedup_mode(request.args.get("dedup", config.get("dedup_mode")))
+    except ValueError as e:
+        return api_response(str(e), "error", 400)
+
+    def persist(tasks):
+        return task_writer.insert_tasks(tasks, dedup)
+
+    def generate():
+        totals = {"chunks": 0, "accepted": 0, "rejected": 0}
+        for ack in ingest_task_stream(request.stream, persist, chunk_size):
+            totals["chunks"] += 1
+            totals["accepted"] += ack["accepted"]
+            totals["rejected"] += ack["rejected"]
+            yield dumps(ack) + b"\n"
+        yield encode_response(totals) + b"\n"
+
+    return Response(stream_with_context(generate()), mimetype="application/x-ndjson")
+
+
+
+@bp.route('/metrics')
+def prometheus_metrics():
+    """Prometheus metrics endpoint (this worker's counters only)"""
+    return Response(metrics.render(), mimetype="text/plain; version=0.0.4")
+
+@bp.route('/health')
+@cached_views.cached(ttl=lambda: float(config.get("health_cache_ttl", 1.0)))
 def health():
     """Health check endpoint"""
     return jsonify({
@@ -50,7 +227,8 @@ def health():
         "timestamp": get_timestamp()
     })
 
-@app.route('/')
+@bp.route('/')
+@cached_views.cached()
 def home():
     """Home endpoint"""
     status = get_status()
@@ -65,7 +243,8 @@ def home():
         }
     })
 
-@app.route('/api')
+@bp.route('/api')
+@cached_views.cached()
 def api_docs():
     """API documentation endpoint"""
     return jsonify({
@@ -75,16 +254,105 @@ def api_docs():
         "endpoints": [
             {"path": "/", "method": "GET", "description": "Home page"},
             {"path": "/health", "method": "GET", "description": "Health check"},
-            {"path": "/api", "method": "GET", "description": "API documentation"}
+            {"path": "/api", "method": "GET", "description": "API documentation"},
+            {"path": "/metrics", "method": "GET", "description": "Prometheus metrics"},
+            {"path": "/api/tasks", "method": "GET", "description": "List tasks (filters, cursor pagination)"},
+            {"path": "/api/tasks", "method": "POST", "description": "Create tasks"},
+            {"path": "/api/tasks/search", "method": "GET", "description": "Full-text search (q=)"},
+            {"path": "/api/tasks/stream", "method": "POST", "description": "Bulk ingest tasks (NDJSON)"},
+            {"path": "/api/tasks/export", "method": "GET", "description": "Export tasks (NDJSON/CSV, streamed)"},
+            {"path": "/api/tasks/batch", "method": "PATCH", "description": "Update many tasks"},
+            {"path": "/api/tasks/batch", "method": "DELETE", "description": "Delete many tasks"}
         ]
     })
 
+def create_app(config_path: str = "config.json") -> Flask:
+    """
+    Build the Flask app
+    
+    Opens the task store (behind a group committer when group_commit is
+    set), starts the log writer and sizes the caches from config, then
+    registers the routes. The store and caches belong to this app, so apps
+    built from different configs are independent; the log writer is shared
+    by the process. Gunicorn can call this directly:
+    `gunicorn 'todo_app:create_app()'`.
+    
+    Args:
+        config_path: Path to config file
+        
+    Returns:
+        Flask: Configured app
+    """
+    app = Flask(__name__)
+    app.json = FastJSONProvider(app)
+
+    settings = get_config(config_path)
+    task_store = TaskStore(settings.get("db_path", "tasks.db"), settings.get("db_synchronous", "NORMAL"))
+    if settings.get("dedup_bloom_capacity"):
+        task_store.enable_digest_filter(int(settings["dedup_bloom_capacity"]))
+    task_writer = task_store
+    if settings.get("group_commit"):
+        task_writer = GroupCommitter(
+            task_store,
+            max_delay=float(settings.get("group_commit_max_delay_ms", 0.0)) / 1000,
+            max_tasks=int(settings.get("group_commit_max_tasks", 5000))
+        )
+        atexit.register(task_writer.close)
+    get_log_writer(
+        path=settings.get("log_path", "app.log"),
+        json_lines=bool(settings.get("log_json", False)),
+        max_bytes=int(settings.get("log_max_bytes", 10 * 1024 * 1024)),
+        max_queue=int(settings.get("log_queue_size", 10000))
+    )
+    idempotency = IdempotencyCache(
+        max_entries=int(settings.get("idempotency_cache_size", 10000)),
+        ttl=float(settings.get("idempotency_ttl", 86400)),
+        spill_path=settings.get("idempotency_spill_path")
+    )
+
+    def apply_config(values):
+        """Apply reloaded settings that live on long-lived objects"""
+        idempotency.max_entries = int(values["idempotency_cache_size"])
+        idempotency.ttl = float(values["idempotency_ttl"])
+        if isinstance(task_writer, GroupCommitter):
+            task_writer.max_delay = float(values["group_commit_max_delay_ms"]) / 1000
+            task_writer.max_tasks = int(values["group_commit_max_tasks"])
+
+    settings.on_reload(apply_config)
+
+    app.extensions["todo"] = {
+        "config": settings,
+        "store": task_store,
+        "task_writer": task_writer,
+        "idempotency_cache": idempotency,
+        "response_cache": ResponseCache()
+    }
+    app.register_blueprint(bp)
+    ResponseCompressor(settings).init_app(app)
+    app.wsgi_app = MetricsMiddleware(app.wsgi_app)
+    cached_views.warm(app)
+    return app
+
+_app = None
+
+def __getattr__(name: str):
+    # `todo_app:app` (manage.sh, gunicorn) builds the app on first access,
+    # so importing this module has no side effects
+    global _app
+    if name != "app":
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    if _app is None:
+        _app = create_app()
+    return _app
+
 if __name__ == '__main__':
-    port = int(os.getenv('PORT', 5000))
-    debug = os.getenv('DEBUG', 'False').lower() == 'true'
+    app = create_app()
+    settings = app.extensions["todo"]["config"]
+    port = int(os.getenv('PORT', settings.get('port', 5000)))
+    debug = os.getenv('DEBUG', str(settings.get('debug', False))).lower() == 'true'
     
     print(f"🚀 Starting todo app on port {port}")
-    print(f"🌐 Server: http://localhost:5000")
-    print(f"🔍 Health check: http://localhost:5000/health")
+    print(f"🌐 Server: http://localhost:{port}")
+    print(f"🔍 Health check: http://localhost:{port}/health")
     
     app.run(host='0.0.0.0', port=port, debug=debug)
@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+"""
+todo app (asyncio)
+ASGI build of the task API
+
+Serves /health and the /api/tasks endpoints (including search and batch)
+from async handlers so a single worker can keep many requests in flight.
+Request parsing and task building come from modules.core, exactly as in
+todo_app.py; storage goes through AsyncTaskStore so SQLite I/O never
+blocks the event loop.
+
+Run with: ./manage.sh start async  (or: uvicorn todo_asgi:app)
+"""
+
+from typing import Any, Awaitable, Callable, Dict, Tuple
+from urllib.parse import parse_qsl
+
+from modules.core import (
+    input_tasks, parse_task_payload, parse_list_query, task_page,
+    parse_batch_update, parse_batch_delete, parse_search_query, parse_dedup_mode
+)
+from modules.utils import get_timestamp
+from modules.config import get_config
+from modules.storage import AsyncTaskStore, get_store
+from modules.serializer import dumps, loads, encode_response
+
+config = get_config()
+store = AsyncTaskStore(
+    get_store(config.get("db_path", "tasks.db"), config.get("db_synchronous", "NORMAL")),
+    max_workers=int(config.get("threads", 4))
+)
+
+Handler = Callable[[Dict[str, Any], bytes], Awaitable[Tuple[int, bytes]]]
+
+
+def _is_json(scope: Dict[str, Any]) -> bool:
+    """True if the request declares a JSON body"""
+    headers = dict(scope["headers"])
+    return headers.get(b"content-type", b"").startswith(b"application/json")
+
+
+async def health(scope: Dict[str, Any], body: bytes) -> Tuple[int, bytes]:
+    """Health check endpoint"""
+    return 200, dumps({
+        "status": "healthy",
+        "service": "todo_app",
+        "timestamp": get_timestamp()
+    })
+
+
+async def api_input_tasks(scope: Dict[str, Any], body: bytes) -> Tuple[int, bytes]:
+    """
+    Accepts a JSON list of task descriptions, persists them and returns
+    the stored tasks with their allocated ids.
+    Request body: {"tasks": ["task1", "task2", ...]}
+    """
+    if not _is_json(scope):
+        return 400, encode_response("Invalid or missing JSON", "error")
+    args = dict(parse_qsl(scope["query_string"].decode()))
+    try:
+        dedup = parse_dedup_mode(args.get("dedup", config.get("dedup_mode")))
+        tasks = parse_task_payload(loads(body))
+    except ValueError as e:
+        return 400, encode_response(str(e), "error")
+    result = await store.insert_tasks(input_tasks(tasks), dedup)
+    return 200, encode_response(result)
+
+
+async def api_list_tasks(scope: Dict[str, Any], body: bytes) -> Tuple[int, bytes]:
+    """
+    Lists stored tasks ordered by (created, id) with keyset pagination.
+    Same query parameters as GET /api/tasks in todo_app.py.
+    """
+    args = dict(parse_qsl(scope["query_string"].decode()))
+    try:
+        query = parse_list_query(
+            args,
+            int(config.get("page_size", 50)),
+            int(config.get("max_page_size", 500))
+        )
+    except ValueError as e:
+        return 400, encode_response(str(e), "error")
+    return 200, encode_response(task_page(*await store.list_tasks(**query)))
+
+
+async def api_search_tasks(scope: Dict[str, Any], body: bytes) -> Tuple[int, bytes]:
+    """Full-text search over task descriptions (see todo_app.py)"""
+    args = dict(parse_qsl(scope["query_string"].decode()))
+    try:
+        query = parse_search_query(
+            args,
+            int(config.get("page_size", 50)),
+            int(config.get("max_page_size", 500))
+        )
+        return 200, encode_response(await store.search_tasks(**query))
+    except ValueError as e:
+        return 400, encode_response(str(e), "error")
+
+
+async def api_update_tasks(scope: Dict[str, Any], body: bytes) -> Tuple[int, bytes]:
+    """Updates many tasks in a single transaction (see todo_app.py)"""
+    if not _is_json(scope):
+        return 400, encode_response("Invalid or missing JSON", "error")
+    try:
+        changes = parse_batch_update(loads(body), int(config.get("max_batch_size", 1000)))
+    except ValueError as e:
+        return 400, encode_response(str(e), "error")
+    return 200, encode_response(await store.update_tasks(changes))
+
+
+async def api_delete_tasks(scope: Dict[str, Any], body: bytes) -> Tuple[int, bytes]:
+    """Deletes many tasks in a single transaction (see todo_app.py)"""
+    if not _is_json(scope):
+        return 400, encode_response("Invalid or missing JSON", "error")
+    try:
+        task_ids = parse_batch_delete(loads(body), int(config.get("max_batch_size", 1000)))
+    except ValueError as e:
+        return 400, encode_response(str(e), "error")
+    return 200, encode_response(await store.delete_tasks(task_ids))
+
+
+ROUTES: Dict[Tuple[str, str], Handler] = {
+    ("GET", "/health"): health,
+    ("GET", "/api/tasks"): api_list_tasks,
+    ("POST", "/api/tasks"): api_input_tasks,
+    ("GET", "/api/tasks/search"): api_search_tasks,
+    ("PATCH", "/api/tasks/batch"): api_update_tasks,
+    ("DELETE", "/api/tasks/batch"): api_delete_tasks,
+}
+
+
+async def _read_body(receive: Callable) -> bytes:
+    """Collect the full request body"""
+    chunks = []
+    more = True
+    while more:
+        message = await receive()
+        chunks.append(message.get("body", b""))
+        more = message.get("more_body", False)
+    return b"".join(chunks)
+
+
+async def _lifespan(receive: Callable, send: Callable) -> None:
+    """Handle ASGI startup/shutdown events"""
+    while True:
+        message = await receive()
+        if message["type"] == "lifespan.startup":
+            await send({"type": "lifespan.startup.complete"})
+        elif message["type"] == "lifespan.shutdown":
+            store.close()
+            await send({"type": "lifespan.shutdown.complete"})
+            return
+
+
+async def app(scope: Dict[str, Any], receive: Callable, send: Callable) -> None:
+    """ASGI entry point"""
+    if scope["type"] == "lifespan":
+        await _lifespan(receive, send)
+        return
+    if scope["type"] != "http":
+        return
+
+    handler = ROUTES.get((scope["method"], scope["path"]))
+    if handler is None:
+        allowed = any(path == scope["path"] for _, path in ROUTES)
+        code = 405 if allowed else 404
+        body = encode_response("Method not allowed" if allowed else "Not found", "error")
+    else:
+        code, body = await handler(scope, await _read_body(receive))
+
+    await send({
+        "type": "http.response.start",
+        "status": code,
+        "headers": [
+            (b"content-type", b"application/json"),
+            (b"content-length", str(len(body)).encode())
+        ]
+    })
+    await send({"type": "http.response.body", "body": body})